@@ -758,11 +758,16 @@ class DataStruct:
 class BeamPool:
     def __init__(self, doc):  # , factory
         self._doc = doc
+        # Shared geometries are registered with the document, so the exporters can write them once.
+        # Runtimes without the registry fall back to comparing the DataStructs.
+        if hasattr(doc, 'getGeometryInstanceRegistry'):
+            self._registry = doc.getGeometryInstanceRegistry()
+        else:
+            self._registry = None
         self._dict_list = []
         # self._factory = factory
 
     def createBeam(self, new_dataStr):
-        # print("Start of creating", len(self._dict_list))
         bmfc = BeamFactory(self._doc)
         beam = lx.SubElement.createIn(self._doc)
         geom = self._isInPool(new_dataStr)
@@ -775,23 +780,30 @@ class BeamPool:
             beam = bmfc.getCutBeam(new_dataStr)
             geom = beam.getGeometry()
             self._addToPoool(new_dataStr, geom)
-        # print("Finish of creating", len(self._dict_list))
         return beam
 
     def _isInPool(self, new_dataStr):
-        """
-        TODO:
-        """
+        if self._registry is not None:
+            return self._registry.find(self._poolKey(new_dataStr))
         for el in self._dict_list:
             if new_dataStr == el['data']:
-                # print("equal")
                 return el['geom']
-        else:
-            # print("not equal")
-            return None
+        return None
 
     def _addToPoool(self, new_dataStr, geom):
-        self._dict_list.append({'data': new_dataStr, 'geom': geom})
+        if self._registry is not None:
+            self._registry.add(self._poolKey(new_dataStr), geom)
+        else:
+            self._dict_list.append({'data': new_dataStr, 'geom': geom})
+
+    def _poolKey(self, dataStr):
+        # Same values as DataStruct.__eq__ compares, quantized by the registry (default tolerance 1E-03 = eps_DS)
+        sn = dataStr.strNorm_LCS
+        en = dataStr.endNorm_LCS
+        params = [dataStr.length, dataStr.weight, dataStr.height,
+                  sn.x(), sn.y(), sn.z(),
+                  en.x(), en.y(), en.z()]
+        return self._registry.makeKey(str(dataStr.bmType), params)
 
 
 class BeamFactory:
@@ -33,6 +33,9 @@ face = Topo.FaceTool.makeFace(Topo.ShapeTool.isSingleWire(shape))
 # shape = geometry.getShape()
 # face = Topo.FaceTool.isSingleFace(shape)
 
+# The classifier prepares the face once, so testing many points against it is cheap.
+classifier = Topo.FacePointClassifier(face)
+
 #------------------------------------------------------------------------------------------
 # 3. We compute a regular grid of points, but only those inside the circle will be created.
 #------------------------------------------------------------------------------------------
@@ -47,14 +50,18 @@ numintervalX = math.floor(lengthX / spacing)
 numintervalY = math.floor(lengthY / spacing)
 dX = lengthX / numintervalX
 dY = lengthY / numintervalY
+grid = Geom.vector_Pnt()
 for i in range(int(numintervalY + 1)):
  for j in range(int(numintervalX + 1)):
-    pnt = Geom.Pnt(startX + dX * j, startY + dY * i, 0.)
-    if Topo.FaceTool.isValidPointForFace(pnt, face): # This function tests if the given point is inside the given face
-     cPnt = lx.CartesianPoint.createIn(doc)
-     cPnt.setPoint(pnt)
-     e = lx.Element.createIn(doc)
-     e.setGeometry(cPnt)
-     e.getDrawStyle().setPointSize(2)
+    grid.append(Geom.Pnt(startX + dX * j, startY + dY * i, 0.))
+
+states = classifier.classifyPoints(grid) # This function tests all points of the grid against the face in one call
+for pnt, state in zip(grid, states):
+    if state != Topo.PointFaceState_OUTSIDE:
+        cPnt = lx.CartesianPoint.createIn(doc)
+        cPnt.setPoint(pnt)
+        e = lx.Element.createIn(doc)
+        e.setGeometry(cPnt)
+        e.getDrawStyle().setPointSize(2)
      
 doc.recompute()
\ No newline at end of file
@@ -0,0 +1,33 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+##########################################################################
+
+box = Geom.Bnd_Box(Geom.Pnt(0, 0, 0), Geom.Pnt(10, 10, 10))
+
+points = Geom.vector_Pnt()
+for x in (-5, 5, 15):
+    points.append(Geom.Pnt(x, 5, 5))
+print("IsOutPoints: ", list(box.IsOutPoints(points)), " (expected 1, 0, 1)")
+
+# Unit boxes at x = 0, 4, 8, 12
+minCorners = Geom.vector_Pnt()
+maxCorners = Geom.vector_Pnt()
+for i in range(4):
+    minCorners.append(Geom.Pnt(4 * i, 0, 0))
+    maxCorners.append(Geom.Pnt(4 * i + 1, 1, 1))
+print("IsOutBoxes: ", list(box.IsOutBoxes(minCorners, maxCorners)), " (expected 0, 0, 0, 1)")
+
+# The same boxes shifted by 0.5 in x overlap their originals only
+minCornersB = Geom.vector_Pnt([Geom.Pnt(p.x() + 0.5, p.y(), p.z()) for p in minCorners])
+maxCornersB = Geom.vector_Pnt([Geom.Pnt(p.x() + 0.5, p.y(), p.z()) for p in maxCorners])
+pairs = Geom.Bnd_Box.OverlappingPairs(minCorners, maxCorners, minCornersB, maxCornersB, 0.0)
+print("OverlappingPairs: ", [(pairs[k], pairs[k + 1]) for k in range(0, len(pairs), 2)], " (expected (0,0), (1,1), (2,2), (3,3))")
+
+plane = Geom.Pln(Geom.Pnt(4.5, 0, 0), Geom.Dir(1, 0, 0))
+print("intersectBBoxesWithPlane: ", list(Geom.GeomTools.intersectBBoxesWithPlane(minCorners, maxCorners, plane)), " (expected 0, 1, 0, 0)")
+
+line  = Geom.Lin(Geom.Pnt(-1, 0.5, 0.5), Geom.Dir(1, 0, 0))
+pnear = Geom.vector_Pnt()
+pfar  = Geom.vector_Pnt()
+hits  = Geom.GeomTools.intersectLineWithBBoxes(line, minCorners, maxCorners, pnear, pfar)
+print("intersectLineWithBBoxes: ", list(hits), " (expected 1, 1, 1, 1), first entry point: ", pnear[0].x(), " (expected 0)")
@@ -0,0 +1,34 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+##########################################################################
+doc   = lx.Application.getInstance().getActiveDocument()
+
+def createBlock(x):
+    e = lx.Element.createIn(doc)
+    block = lx.Block.createIn(doc)
+    block.setXLength(1)
+    block.setYLength(1)
+    block.setZLength(1)
+    e.setGeometry(block)
+    e.translate(Geom.Vec(x, 0, 0))
+    return e
+
+# Three overlapping pairs and one element far away
+elems = [createBlock(x) for x in (0, 0.5, 10, 10.5, 20, 20.5, 100)]
+doc.recompute()
+
+detector = lx.ClashDetector(doc)
+detector.setClashMode(Topo.ClashMode_CLASH_CLASSIFY_BODIES)
+count = detector.run()
+print("run found ", count, " clashes (expected 3), candidate pairs: ", detector.getCandidatePairCount())
+for clash in detector.getClashes():
+    print("  ", clash.First.getId(), " - ", clash.Second.getId(), ": ", clash.ClashType)
+
+# Only the moved element is checked again
+detector.setIncremental(True)
+elems[-1].translate(Geom.Vec(-78.8, 0, 0))
+doc.recompute()
+print("pending elements: ", detector.getPendingCount())
+count = detector.update()
+print("update found ", count, " clashes (expected 4), candidate pairs: ", detector.getCandidatePairCount())
+print("clashes of the moved element: ", len(detector.getClashes(elems[-1])), " (expected 1)")
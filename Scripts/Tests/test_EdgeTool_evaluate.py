@@ -0,0 +1,37 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+import  math
+##########################################################################
+
+def fmt(v):
+    return (round(v.x(), 6), round(v.y(), 6), round(v.z(), 6))
+
+# Quarter circle with radius 1 around the origin
+edge = Topo.EdgeTool.makeArcOfCircle(Geom.Pnt(1, 0, 0), Geom.Pnt(math.sqrt(0.5), math.sqrt(0.5), 0), Geom.Pnt(0, 1, 0))
+first = Base.Double()
+last  = Base.Double()
+Topo.EdgeTool.firstParameter(edge, first)
+Topo.EdgeTool.lastParameter(edge, last)
+u0, u1 = first.value, last.value
+params = Base.vector_double([u0 + (u1 - u0) * i / 4 for i in range(5)])
+
+points = Topo.EdgeTool.evaluate(edge, params)
+print("evaluate: ", [fmt(p) for p in points])
+
+points = Geom.vector_Pnt()
+d1 = Geom.vector_Vec()
+d2 = Geom.vector_Vec()
+d3 = Geom.vector_Vec()
+ok = Topo.EdgeTool.evaluate(edge, params, 2, points, d1, d2, d3)
+print("evaluate with derivatives returned ", ok, ": ", len(points), " points, ", len(d1), " d1, ", len(d2), " d2, ", len(d3), " d3 (expected 5, 5, 5, 0)")
+print("  d1 at the start: ", fmt(d1[0]))
+
+# Polyline 0,0 -> 10,0 -> 10,5, evaluated by arc length
+wire = Topo.WireTool.makePolygon(Geom.vector_Pnt([Geom.Pnt(0, 0, 0), Geom.Pnt(10, 0, 0), Geom.Pnt(10, 5, 0)]))
+print("wire length: ", Topo.WireTool.getLength(wire), " (expected 15)")
+
+lengths = Base.vector_double([0, 5, 12, 20])
+edgeIndices = Base.vector_int()
+ok = Topo.WireTool.evaluateAtLength(wire, lengths, 1, points, d1, d2, d3, edgeIndices)
+print("evaluateAtLength returned ", ok, ": ", [fmt(p) for p in points], " (the last length is clamped)")
+print("  tangents: ", [fmt(v) for v in d1], ", edges: ", list(edgeIndices), " (expected 0, 0, 1, 1)")
@@ -0,0 +1,36 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+##########################################################################
+
+# A 10 x 10 square face in the XY plane
+points = Geom.vector_Pnt()
+for p in ((0, 0, 0), (10, 0, 0), (10, 10, 0), (0, 10, 0), (0, 0, 0)):
+    points.append(Geom.Pnt(*p))
+face = Topo.FaceTool.makeFace(Topo.WireTool.makePolygon(points))
+
+classifier = Topo.FacePointClassifier(face)
+print("isValid returned: ", classifier.isValid(), " (expected True)")
+
+print("classify inside: ", classifier.classify(Geom.Pnt(5, 5, 0)) == Topo.PointFaceState_INSIDE, " (expected True)")
+print("classify on boundary: ", classifier.classify(Geom.Pnt(10, 5, 0)) == Topo.PointFaceState_ON_BOUNDARY, " (expected True)")
+print("classify above the plane: ", classifier.classify(Geom.Pnt(5, 5, 1)) == Topo.PointFaceState_OUTSIDE, " (expected True)")
+
+grid = Geom.vector_Pnt()
+for i in range(-2, 13):
+    for j in range(-2, 13):
+        grid.append(Geom.Pnt(j + 0.5, i + 0.5, 0))
+states = classifier.classifyPoints(grid)
+inside = sum(1 for s in states if s == Topo.PointFaceState_INSIDE)
+print("classifyPoints returned ", len(states), " states (expected 225), ", inside, " inside (expected 100)")
+
+# The same grid in the coordinates of the face plane
+position = classifier.getPosition()
+origin = position.location()
+xDir = Geom.Vec(position.xDirection())
+yDir = Geom.Vec(position.yDirection())
+grid2d = Geom.vector_Pnt2d()
+for p in grid:
+    v = Geom.Vec(origin, p)
+    grid2d.append(Geom.Pnt2d(v.dot(xDir), v.dot(yDir)))
+states2d = classifier.classifyPoints2d(grid2d)
+print("classifyPoints2d returned the same states: ", list(states2d) == list(states), " (expected True)")
@@ -0,0 +1,28 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+##########################################################################
+
+points = Geom.vector_Pnt()
+for i in range(10):
+    points.append(Geom.Pnt(i, 2 * i, 5))
+
+plane = Geom.Pln(Geom.Pnt(0, 0, 0), Geom.Dir(0, 0, 1))
+line  = Geom.Lin(Geom.Pnt(0, 0, 0), Geom.Dir(1, 0, 0))
+
+projected = Geom.GeomTools.projectPointsOnPlane(points, plane)
+print("projectPointsOnPlane returned ", len(projected), " points, first: ", projected[0].x(), projected[0].y(), projected[0].z())
+
+distances = Geom.GeomTools.getSignedDistancesFromPointsToPlane(points, plane)
+print("getSignedDistancesFromPointsToPlane: ", list(distances))
+
+distances = Geom.GeomTools.getDistancesFromPointsToLine(points, line)
+print("getDistancesFromPointsToLine: ", list(distances))
+
+distances = Geom.GeomTools.getDistancesBetweenPoints(points, projected)
+print("getDistancesBetweenPoints: ", list(distances))
+
+index = Geom.GeomTools.findClosestPointIndex(Geom.Pnt(3.2, 6.1, 5), points)
+print("findClosestPointIndex returned ", index, " (expected 3)")
+
+index = Geom.GeomTools.findClosestPointIndex(Geom.Pnt(0, 0, 0), Geom.vector_Pnt())
+print("findClosestPointIndex on an empty vector returned ", index, " (expected -1)")
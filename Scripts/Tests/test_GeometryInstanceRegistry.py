@@ -0,0 +1,32 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+##########################################################################
+doc   = lx.Application.getInstance().getActiveDocument()
+
+reg = doc.getGeometryInstanceRegistry()
+reg.clear()
+print("tolerance: ", reg.getTolerance())
+
+key1 = reg.makeKey("block", [1.0, 2.0, 3.0])
+key2 = reg.makeKey("block", [1.0 + 1E-06, 2.0, 3.0])
+key3 = reg.makeKey("block", [1.0, 2.0, 4.0])
+print("keys within the tolerance are equal: ", key1 == key2, ", different parameters give another key: ", key1 != key3)
+
+print("find before add returns None: ", reg.find(key1) is None)
+
+block = lx.Block.createIn(doc)
+block.setXLength(1)
+block.setYLength(2)
+block.setZLength(3)
+reg.add(key1, block)
+
+for i in range(3):
+    geom = reg.find(key1)
+    e = lx.Element.createIn(doc)
+    e.setGeometry(geom)
+    e.translate(Geom.Vec(5 * i, 0, 0))
+doc.recompute()
+
+print("size: ", reg.size(), " (expected 1), hits: ", reg.getHitCount(), " (expected 3), misses: ", reg.getMissCount(), " (expected 1)")
+print("use count: ", reg.getGeometryUseCount(block), " (expected 3), isShared: ", reg.isShared(block))
+print("makeShapeKey: ", reg.makeShapeKey(block.computeShape()))
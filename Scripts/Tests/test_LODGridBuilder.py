@@ -0,0 +1,33 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+import  os, tempfile, time
+##########################################################################
+lxstr = Base.StringTool.toString
+##########################################################################
+
+folder       = tempfile.mkdtemp()
+pointFile    = os.path.join(folder, "points.xyz")
+lodFile      = os.path.join(folder, "points.lod")
+
+with open(pointFile, "w") as f:
+    for i in range(100000):
+        f.write("%f %f %f\n" % (i % 100, (i // 100) % 100, i // 10000))
+
+builder = Geom.LODGridBuilder(32)
+ok = builder.startBuildToFile(lxstr(pointFile), Geom.LODGridBuilder.PointFileFormat_XYZ_TEXT, lxstr(lodFile))
+print("startBuildToFile returned: ", ok)
+while builder.isRunning():
+    print("progress: ", builder.getProgress(), "%")
+    time.sleep(0.1)
+print("wait returned: ", builder.wait(), ", points read: ", builder.getNumPointsRead(), " (expected 100000)")
+
+ids = Geom.LODGridBuilder.readNodeIds(lxstr(lodFile))
+print("readNodeIds returned ", len(ids), " nodes")
+if len(ids) > 0:
+    points = Geom.vector_Pnt()
+    colors = Base.vector_Color()
+    ok = Geom.LODGridBuilder.readNodePoints(lxstr(lodFile), ids[0], points, colors)
+    print("readNodePoints(", ids[0], ") returned ", ok, " with ", len(points), " points")
+
+ok = Geom.LODGridBuilder.readNodePoints(lxstr(lodFile), "no such node", Geom.vector_Pnt(), Base.vector_Color())
+print("readNodePoints of an unknown node returned: ", ok, " (expected False)")
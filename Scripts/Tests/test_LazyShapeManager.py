@@ -0,0 +1,60 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+##########################################################################
+doc   = lx.Application.getInstance().getActiveDocument()
+
+def makeLazyCube(x):
+    # Model description of a unit cube (see Geom::BrepData): -2 ends a loop, -1 ends a face
+    vertices = Geom.vector_Pnt()
+    for p in ((0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)):
+        vertices.append(Geom.Pnt(p[0] + x, p[1], p[2]))
+    model = Base.vector_int()
+    for face in ((0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)):
+        for i in face:
+            model.append(i)
+        model.append(-2)
+        model.append(-1)
+    return Topo.ShapeTool.makeLazyFacetedBrepShape(model, vertices, Geom.PointListSet())
+
+shapes = [makeLazyCube(2 * i) for i in range(5)]
+
+budget = Topo.LazyShapeManager.getMemoryBudget()
+Topo.LazyShapeManager.releaseAll()
+Topo.LazyShapeManager.resetStatistics()
+
+# Memory of one materialized BREP without a budget
+Topo.LazyShapeManager.setMemoryBudget(0)
+print("materializeShape returned: ", Topo.LazyShapeManager.materializeShape(shapes[0]), " (expected True)")
+shapeSize = Topo.LazyShapeManager.getMemoryUsage()
+print("memory of one BREP: ", shapeSize, " bytes (expected > 0)")
+Topo.LazyShapeManager.releaseAll()
+
+# A budget for two and a half BREPs keeps the two most recently used ones
+smallBudget = int(2.5 * shapeSize)
+Topo.LazyShapeManager.setMemoryBudget(smallBudget)
+Topo.LazyShapeManager.resetStatistics()
+for s in shapes:
+    Topo.LazyShapeManager.materializeShape(s)
+print("getMaterializationCount: ", Topo.LazyShapeManager.getMaterializationCount(), " (expected 5)")
+print("getEvictionCount: ", Topo.LazyShapeManager.getEvictionCount(), " (expected 3)")
+print("getMemoryUsage: ", Topo.LazyShapeManager.getMemoryUsage(), " <= budget: ",
+      Topo.LazyShapeManager.getMemoryUsage() <= smallBudget, " (expected True)")
+print("getMaterializedCount: ", Topo.LazyShapeManager.getMaterializedCount(), " (expected 2)")
+
+# touchShape() makes shapes[3] the most recently used, so materializing shapes[0] again evicts shapes[4]
+Topo.LazyShapeManager.touchShape(shapes[3])
+evictions = Topo.LazyShapeManager.getEvictionCount()
+Topo.LazyShapeManager.materializeShape(shapes[0])
+print("evictions after touchShape and materializeShape: ", Topo.LazyShapeManager.getEvictionCount() - evictions, " (expected 1)")
+Topo.LazyShapeManager.materializeShape(shapes[3])
+print("materializing the touched shape again builds no BREP: ", Topo.LazyShapeManager.getMaterializationCount(), " (expected 6)")
+
+# Shapes which are not lazy are ignored
+e = lx.Element.createIn(doc)
+e.setGeometry(lx.Block.createIn(doc))
+doc.recompute()
+print("materializeShape of a block shape returned: ", Topo.LazyShapeManager.materializeShape(e.getShape()), " (expected False)")
+
+Topo.LazyShapeManager.releaseAll()
+print("getMaterializedCount after releaseAll: ", Topo.LazyShapeManager.getMaterializedCount(), " (expected 0)")
+Topo.LazyShapeManager.setMemoryBudget(budget)
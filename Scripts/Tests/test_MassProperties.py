@@ -0,0 +1,36 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+##########################################################################
+doc   = lx.Application.getInstance().getActiveDocument()
+
+# Create a row of 2 x 3 x 4 blocks
+elements = lx.vector_Element()
+for i in range(5):
+    e = lx.Element.createIn(doc)
+    block = lx.Block.createIn(doc)
+    block.setXLength(2)
+    block.setYLength(3)
+    block.setZLength(4)
+    e.setGeometry(block)
+    e.translate(Geom.Vec(10 * i, 0, 0))
+    elements.append(e)
+doc.recompute()
+
+shapes = Topo.vector_ConstShape()
+for e in elements:
+    shapes.append(e.getShape())
+
+n = Topo.MassProperties.TABLE_COLUMNS
+Topo.ShapeTool.clearMassPropertiesCache()
+hits = Topo.ShapeTool.getMassPropertiesCacheHitCount()
+table = Topo.ShapeTool.getMassPropertiesTable(shapes, True)
+print("getMassPropertiesTable returned ", len(table) // n, " rows (expected 5)")
+for i in range(len(shapes)):
+    row = table[i * n:(i + 1) * n]
+    print("  valid: ", row[0], " (expected 1), volume: ", row[1], " (expected 24), surface area: ", row[2], " (expected 52), centroid: ", row[3], row[4], row[5], ", area from top: ", row[9], " (expected 6)")
+
+table = Topo.ShapeTool.getMassPropertiesTable(shapes)
+print("cache hits of the second call: ", Topo.ShapeTool.getMassPropertiesCacheHitCount() - hits, " (expected 5)")
+
+table = lx.Element.getMassPropertiesTable(elements)
+print("Element.getMassPropertiesTable returned ", len(table) // n, " rows (expected 5), first volume: ", table[1], " (expected 24)")
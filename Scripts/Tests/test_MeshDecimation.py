@@ -0,0 +1,52 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+import  os, tempfile
+##########################################################################
+lxstr = Base.StringTool.toString
+##########################################################################
+doc   = lx.Application.getInstance().getActiveDocument()
+
+# Create a test Element
+e = lx.Element.createIn(doc)
+sphere = lx.Sphere.createIn(doc)
+sphere.setRadius(5)
+e.setGeometry(sphere)
+doc.recompute()
+
+mesh = Topo.MeshTool.triangulationToMesh(e.getShape())
+print("triangulationToMesh: ", len(mesh.getPoints()), " points")
+
+options = Topo.MeshDecimationOptions()
+options.target = Topo.MeshDecimationOptions.Target_Ratio
+options.targetRatio = 0.25
+decimated = Topo.MeshTool.decimate(mesh, options)
+print("decimate with Target_Ratio 0.25: ", len(decimated.getPoints()), " points")
+
+# No count target, only the error limits the decimation
+options.target = Topo.MeshDecimationOptions.Target_None
+options.maxError = 0.1
+decimated = Topo.MeshTool.decimate(mesh, options)
+print("decimate with Target_None and maxError 0.1: ", len(decimated.getPoints()), " points")
+
+ratios = Base.vector_double()
+for r in (0.5, 0.25, 0.1):
+    ratios.append(r)
+lods = Topo.MeshTool.makeLODs(mesh, ratios, 0.5)
+print("makeLODs returned ", len(lods), " levels (expected 3)")
+for lod in lods:
+    print("  isMesh: ", Topo.ShapeTool.isMesh(lod))
+
+print("createMeshLODs returned: ", e.createMeshLODs(ratios), " (expected 3)")
+print("getMeshLODCount returned: ", e.getMeshLODCount(), " (expected 4)")
+
+ex = lx.OBJ_Exporter.createIn(doc)
+res = ex.exportFile(lxstr(os.path.join(tempfile.gettempdir(), "test_lod.obj")), 2)
+print("OBJ_Exporter with level 2 returned: ", res)
+
+ex = lx.WebGL_Exporter.createIn(doc)
+ex.setSingleHtmlFile(True)
+res = ex.exportFile(lxstr(os.path.join(tempfile.gettempdir(), "test_lod.html")), 2)
+print("WebGL_Exporter with level 2 returned: ", res)
+
+e.clearMeshLODs()
+print("getMeshLODCount after clearMeshLODs returned: ", e.getMeshLODCount(), " (expected 1)")
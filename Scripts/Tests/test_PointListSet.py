@@ -0,0 +1,25 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+##########################################################################
+
+lists = Geom.vector_vector_Pnt()
+for n in (3, 4, 5):
+    pnts = Geom.vector_Pnt()
+    for i in range(n):
+        pnts.append(Geom.Pnt(i, n, 0))
+    lists.append(pnts)
+
+pls = Geom.PointListSet(lists)
+print("numLists: ", pls.numLists(), " (expected 3), numPoints: ", pls.numPoints(), " (expected 12)")
+print("listSize(1): ", pls.listSize(1), " (expected 4), offset(2): ", pls.offset(2), " (expected 7)")
+print("getList(2): ", [(p.x(), p.y(), p.z()) for p in pls.getList(2)])
+p = pls.getPoint(1, 3)
+print("getPoint(1, 3): ", p.x(), p.y(), p.z())
+print("toVectors returned ", len(pls.toVectors()), " lists")
+
+for call in (lambda: pls.getList(3), lambda: pls.getPoint(0, 3), lambda: pls.listSize(-1), lambda: pls.offset(4)):
+    try:
+        call()
+        print("ERROR: no exception for an index out of range")
+    except IndexError as e:
+        print("IndexError as expected: ", e)
@@ -0,0 +1,46 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+##########################################################################
+
+# Every point is given twice, the second time moved by less than the tolerance
+points = Geom.vector_Pnt()
+for i in range(5):
+    points.append(Geom.Pnt(i, 0, 0))
+for i in range(5):
+    points.append(Geom.Pnt(i + 1E-05, 0, 0))
+
+remap        = Base.vector_int()
+uniquePoints = Geom.vector_Pnt()
+Geom.PointMapWithTolerance.weldPoints(points, 1E-03, remap, uniquePoints)
+print("weldPoints: ", len(uniquePoints), " unique points (expected 5), remap: ", list(remap))
+
+pointMap = Geom.PointMapWithTolerance(1E-03)
+remap = pointMap.addPointsIfNotExist(points)
+print("addPointsIfNotExist: ", pointMap.numPoints(), " points in the map (expected 5), remap: ", list(remap))
+print("getPoints: ", [(p.x(), p.y(), p.z()) for p in pointMap.getPoints()])
+
+# Pairs which straddle a cell boundary of the grid (cell size = tolerance) are welded as well
+tol = 1E-03
+straddling = Geom.vector_Pnt()
+for k in range(1, 6):
+    straddling.append(Geom.Pnt(10 * k * tol - tol / 4, 0, 0))
+    straddling.append(Geom.Pnt(10 * k * tol + tol / 4, 0, 0))
+remap        = Base.vector_int()
+uniquePoints = Geom.vector_Pnt()
+Geom.PointMapWithTolerance.weldPoints(straddling, tol, remap, uniquePoints)
+print("weldPoints across cell boundaries: ", len(uniquePoints), " unique points (expected 5), remap: ", list(remap))
+
+# Same result as addPointIfNotExists() point by point, also for a chain of points 0.6 * tol apart
+chain = Geom.vector_Pnt()
+for i in range(6):
+    chain.append(Geom.Pnt(i * 0.6 * tol, 0, 0))
+batchMap = Geom.PointMapWithTolerance(tol)
+batchMap.addPointsIfNotExist(chain)
+singleMap = Geom.PointMapWithTolerance(tol)
+for i, p in enumerate(chain):
+    singleMap.addPointIfNotExists(p, i)
+print("addPointsIfNotExist on a chain: ", batchMap.numPoints(), " points, addPointIfNotExists: ", singleMap.numPoints(), " points (expected 3 for both)")
+
+# Points which are already in the map are matched
+remap = batchMap.addPointsIfNotExist(chain)
+print("adding the chain again: ", batchMap.numPoints(), " points (expected 3), remap: ", list(remap))
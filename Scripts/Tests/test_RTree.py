@@ -0,0 +1,26 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+##########################################################################
+
+# Ten unit boxes along the x axis, the payload is the index of the box
+minCorners = Geom.vector_Pnt()
+maxCorners = Geom.vector_Pnt()
+payloads   = Base.vector_int()
+for i in range(10):
+    minCorners.append(Geom.Pnt(2 * i, 0, 0))
+    maxCorners.append(Geom.Pnt(2 * i + 1, 1, 1))
+    payloads.append(i)
+
+tree = Geom.BoxRTree(minCorners, maxCorners, payloads)
+print("BoxRTree size: ", tree.size(), " (expected 10)")
+
+box = Geom.Bnd_Box(Geom.Pnt(3.5, 0, 0), Geom.Pnt(6.5, 1, 1))
+print("queryIntersectsIndices: ", list(tree.queryIntersectsIndices(box)), " (expected 2, 3)")
+print("queryNearestIndices: ", list(tree.queryNearestIndices(Geom.Pnt(9.5, 0.5, 0.5), 3)), " (4 and 5 first)")
+print("queryWithinDistanceIndices: ", list(tree.queryWithinDistanceIndices(Geom.Pnt(9.5, 0.5, 0.5), 1.0)))
+print("querySegmentIndices: ", list(tree.querySegmentIndices(Geom.Pnt(-1, 0.5, 0.5), Geom.Pnt(5, 0.5, 0.5))), " (expected 0, 1, 2)")
+print("queryRayIndices: ", list(tree.queryRayIndices(Geom.Pnt(25, 0.5, 0.5), Geom.Dir(-1, 0, 0), 9.0)), " (expected 9, 8)")
+
+tree.insertIndex(Geom.Bnd_Box(Geom.Pnt(100, 0, 0), Geom.Pnt(101, 1, 1)), 42)
+print("queryNearestIndices after insertIndex: ", list(tree.queryNearestIndices(Geom.Pnt(100, 0, 0), 1)), " (expected 42)")
+print("removeIndex returned: ", tree.removeIndex(Geom.Bnd_Box(Geom.Pnt(100, 0, 0), Geom.Pnt(101, 1, 1)), 42), " (expected True), size: ", tree.size(), " (expected 10)")
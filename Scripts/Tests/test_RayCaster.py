@@ -0,0 +1,39 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+##########################################################################
+doc   = lx.Application.getInstance().getActiveDocument()
+
+# A 1 x 1 x 1 block at the origin
+e = lx.Element.createIn(doc)
+block = lx.Block.createIn(doc)
+block.setXLength(1)
+block.setYLength(1)
+block.setZLength(1)
+e.setGeometry(block)
+doc.recompute()
+
+caster = lx.RayCaster(doc)
+caster.setElements([e])
+print("elements: ", caster.getElementCount(), ", triangles: ", caster.getTriangleCount())
+
+# Vertical rays from above, the first two hit the block
+origins    = Geom.vector_Pnt([Geom.Pnt(0.5, 0.5, 10), Geom.Pnt(0.2, 0.8, 10), Geom.Pnt(5, 5, 10)])
+directions = Geom.vector_Vec([Geom.Vec(0, 0, -1)] * 3)
+
+indices = caster.castRays(origins, directions, -1.0)
+print("castRays: ", list(indices), " (expected 0, 0, -1)")
+
+elementIndices = Base.vector_int()
+faceIndices    = Base.vector_int()
+params         = Base.vector_double()
+normals        = Geom.vector_Vec()
+hits = caster.castRays(origins, directions, -1.0, elementIndices, faceIndices, params, normals)
+print("castRays: ", hits, " hits (expected 2), params ", list(params), " (expected 9, 9, nan)")
+print("normal of the first hit: ", normals[0].x(), normals[0].y(), normals[0].z(), " (expected 0 0 1)")
+
+print("castRaysAnyHit with maxParam 5: ", list(caster.castRaysAnyHit(origins, directions, 5.0)), " (expected 0, 0, 0)")
+
+targets = Geom.vector_Pnt([Geom.Pnt(0.5, 0.5, -10), Geom.Pnt(0.2, 0.8, 5), Geom.Pnt(5, 5, -10)])
+print("testSegments: ", list(caster.testSegments(origins, targets)), " (expected 1, 0, 0)")
+
+print("getElement(0) is the block element: ", caster.getElement(0).getId() == e.getId())
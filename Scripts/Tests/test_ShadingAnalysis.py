@@ -0,0 +1,45 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+import  math
+##########################################################################
+doc   = lx.Application.getInstance().getActiveDocument()
+
+def createBlock(x, y, z, lx_, ly, lz):
+    e = lx.Element.createIn(doc)
+    block = lx.Block.createIn(doc)
+    block.setXLength(lx_)
+    block.setYLength(ly)
+    block.setZLength(lz)
+    e.setGeometry(block)
+    e.translate(Geom.Vec(x, y, z))
+    return e
+
+ground = createBlock(0, 0, 0, 10, 10, 0.1)
+tower  = createBlock(4, 4, 0.1, 2, 2, 5)
+doc.recompute()
+
+study = lx.ShadingAnalysis(doc)
+study.setReceivers([ground])
+study.setSampleSpacing(0.5)
+n = study.getFaceCount()
+print("receiver faces: ", n)
+
+elementIndices = Base.vector_int()
+faceIndices    = Base.vector_int()
+study.getFaces(elementIndices, faceIndices)
+areas = study.getFaceAreas()
+print("faces: ", list(zip(elementIndices, faceIndices)), ", areas: ", list(areas))
+
+# The sun going round in 12 steps at 45 degrees elevation, the last direction is below the horizon
+dirs = Geom.vector_Vec()
+for i in range(12):
+    a = 2 * math.pi * i / 12
+    dirs.append(Geom.Vec(math.cos(a), math.sin(a), 1))
+dirs.append(Geom.Vec(1, 0, -1))
+
+shaded = Base.vector_double()
+lit    = Base.vector_double()
+ok = study.run(dirs, shaded, lit)
+print("run returned ", ok, " with ", len(shaded), " values (expected ", len(dirs) * n, ")")
+for i in range(len(dirs)):
+    print("  direction ", i, ": shaded ", list(shaded[i * n:(i + 1) * n]), ", lit ", list(lit[i * n:(i + 1) * n]))
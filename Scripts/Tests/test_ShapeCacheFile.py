@@ -0,0 +1,46 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+import  os, tempfile
+##########################################################################
+lxstr = Base.StringTool.toString
+cstr  = Base.StringTool.toStlString
+##########################################################################
+doc   = lx.Application.getInstance().getActiveDocument()
+
+# Create a row of test Elements
+shapes = Topo.vector_ConstShape()
+keys   = Base.vector_CString()
+for i in range(5):
+    e = lx.Element.createIn(doc)
+    block = lx.Block.createIn(doc)
+    e.setGeometry(block)
+    e.translate(Geom.Vec(10 * i, 0, 0))
+    doc.recompute()
+    shapes.append(e.getShape())
+    keys.append("element_" + str(i))
+
+fileName = lxstr(os.path.join(tempfile.gettempdir(), "test_shapes.lxsc"))
+res = Topo.ShapeCacheFile.write(fileName, shapes, keys, "source-1")
+print("write returned: ", res, " (expected True), format version: ", Topo.ShapeCacheFile.getFormatVersion())
+
+cache = Topo.ShapeCacheFile()
+print("open with another source hash returned: ", cache.open(fileName, "source-2"), " (expected False)")
+print("open returned: ", cache.open(fileName, "source-1"), " (expected True)")
+print("size: ", cache.size(), " (expected 5), loaded: ", cache.getLoadedCount(), " (expected 0)")
+
+index = cache.findIndex("element_3")
+print("findIndex returned ", index, " (expected 3), key: ", cache.getKey(index), ", data size: ", cache.getDataSize(index))
+shape = cache.getShape("element_3")
+print("getShape returned a shape: ", shape is not None, ", isLoaded: ", cache.isLoaded(index), " (expected True)")
+print("content hash matches: ", cache.getContentHash(index) == Topo.ShapeCacheFile.computeContentHash(shapes[3]), " (expected True)")
+print("findIndex of an unknown key returned ", cache.findIndex("unknown"), " (expected -1)")
+cache.close()
+print("isOpen after close: ", cache.isOpen(), " (expected False)")
+
+# The document writes its shape cache next to the saved file
+doc.setShapeCacheEnabled(True)
+print("isShapeCacheEnabled returned: ", doc.isShapeCacheEnabled())
+doc.saveAs(lxstr(os.path.join(tempfile.gettempdir(), "test_shapes.lxz")))
+cacheFileName = doc.getShapeCacheFileName()
+print("getShapeCacheFileName returned: ", cstr(cacheFileName), ", exists: ", os.path.exists(cstr(cacheFileName)))
+doc.setShapeCacheEnabled(False)
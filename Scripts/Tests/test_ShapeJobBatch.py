@@ -0,0 +1,25 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+##########################################################################
+
+batch = Topo.ShapeJobBatch()
+for i in range(20):
+    placement = Geom.Trsf()
+    placement.setTranslation(Geom.Vec(2 * i, 0, 0))
+    batch.addBox(1.0, 1.0, 3.0, placement)
+cylinder = batch.addCylinder(0.5, 2.0)
+print("ShapeJobBatch size: ", batch.size(), " (expected 21)")
+
+batch.run()
+print("isFinished: ", batch.isFinished(), ", progress: ", batch.getProgress())
+
+shapes = batch.getResults()
+print("getResults returned ", len(shapes), " shapes, volume of the first: ", Topo.ShapeTool.getVolume(shapes[0]), " (expected 3)")
+
+future = batch.getFuture(cylinder)
+print("cylinder job isOkay: ", future.isOkay(), ", error: '", Base.StringTool.toStlString(future.getErrorMessage()), "'")
+
+# The same jobs in the background
+batch.start()
+batch.wait()
+print("start/wait: isFinished = ", batch.isFinished())
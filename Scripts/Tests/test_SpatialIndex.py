@@ -0,0 +1,36 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+##########################################################################
+doc   = lx.Application.getInstance().getActiveDocument()
+
+# Create a row of test Elements
+for i in range(10):
+    e = lx.Element.createIn(doc)
+    block = lx.Block.createIn(doc)
+    e.setGeometry(block)
+    e.translate(Geom.Vec(10 * i, 0, 0))
+doc.recompute()
+
+doc.setSpatialIndexEnabled(True)
+print("isSpatialIndexEnabled returned: ", doc.isSpatialIndexEnabled())
+
+box = Geom.Bnd_Box(Geom.Pnt(-1, -1, -1), Geom.Pnt(25, 1, 1))
+elements = doc.queryElementsInBox(box)
+print("queryElementsInBox returned ", len(elements), " elements")
+
+elements = doc.queryNearestElements(Geom.Pnt(50, 0, 0), 3)
+print("queryNearestElements returned ", len(elements), " elements")
+for e in elements:
+    print("  ", e.getBoundingBox().GetCenter().x())
+
+# The index follows the changes of a recompute
+e = lx.Element.createIn(doc)
+e.setGeometry(lx.Block.createIn(doc))
+e.translate(Geom.Vec(500, 0, 0))
+doc.recompute()
+elements = doc.queryNearestElements(Geom.Pnt(500, 0, 0), 1)
+print("queryNearestElements after recompute returned ", len(elements), " element(s)")
+
+doc.setSpatialIndexEnabled(False)
+elements = doc.queryElementsInBox(box)
+print("queryElementsInBox without index returned ", len(elements), " elements")
@@ -0,0 +1,28 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+##########################################################################
+doc   = lx.Application.getInstance().getActiveDocument()
+
+block = lx.Block.createIn(doc)
+shape1 = block.computeShape()
+shape2 = block.computeShape()   # same geometry, another shape
+quality = Topo.ShapeTessellationQuality()
+
+Topo.TessellationCache.setEnabled(True)
+Topo.TessellationCache.clear()
+Topo.TessellationCache.resetStatistics()
+
+key1 = Topo.TessellationCache.createKey(shape1, quality)
+key2 = Topo.TessellationCache.createKey(shape2, quality)
+print("createKey: ", key1, ", same key for the same geometry: ", key1 == key2)
+
+d1 = Topo.TessellationCache.getOrCreate(shape1, quality)
+d2 = Topo.TessellationCache.getOrCreate(shape2, quality)
+print("getOrCreate returned a drawable: ", d1 is not None and d2 is not None)
+print("hits: ", Topo.TessellationCache.getHitCount(), " (expected 1), misses: ", Topo.TessellationCache.getMissCount(), " (expected 1)")
+print("entries: ", Topo.TessellationCache.getEntryCount(), ", memory usage: ", Topo.TessellationCache.getMemoryUsage(), " bytes")
+
+print("find of an unknown key returns None: ", Topo.TessellationCache.find("no such key") is None)
+
+Topo.TessellationCache.clear()
+Topo.TessellationCache.setEnabled(False)
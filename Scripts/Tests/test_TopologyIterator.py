@@ -0,0 +1,59 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+import  math, time
+##########################################################################
+doc   = lx.Application.getInstance().getActiveDocument()
+
+# A 1 x 1 x 1 block at the origin
+e = lx.Element.createIn(doc)
+block = lx.Block.createIn(doc)
+block.setXLength(1)
+block.setYLength(1)
+block.setZLength(1)
+e.setGeometry(block)
+doc.recompute()
+shape = e.getShape()
+
+for name, it in (("FaceIterator", Topo.FaceIterator(shape)), ("WireIterator", Topo.WireIterator(shape)),
+                 ("EdgeIterator", Topo.EdgeIterator(shape)), ("VertexIterator", Topo.VertexIterator(shape))):
+    count = 0
+    while it.more():
+        it.next()
+        count += 1
+    print(name, ": size ", it.size(), ", visited ", count, ", next() at the end is None: ", it.next() is None)
+print("(expected 6, 6, 12 and 8 items)")
+
+# Stop at the first face on the top
+it = Topo.FaceIterator(shape)
+top = Geom.Pnt(0.5, 0.5, 1)
+while it.more():
+    face = it.next()
+    if Topo.FaceTool.isValidPointForFace(top, face):
+        break
+print("top face found at index ", it.getIndex(), ", same face as getFaceByIndex: ",
+      Topo.ShapeTool.getIndexFromFace(shape, face) == it.getIndex(), " (expected True)")
+it.reset()
+print("getIndex after reset: ", it.getIndex(), " (expected -1)")
+
+box = Geom.Bnd_Box(Geom.Pnt(-0.1, -0.1, 0.9), Geom.Pnt(1.1, 1.1, 1.1))
+print("getFaceIndicesInBox: ", len(Topo.ShapeTool.getFaceIndicesInBox(shape, box)), " faces (expected 5)")
+print("getEdgeIndicesInBox: ", len(Topo.ShapeTool.getEdgeIndicesInBox(shape, box)), " edges (expected 8)")
+print("getFaceIndicesByNormal: ", len(Topo.ShapeTool.getFaceIndicesByNormal(shape, Geom.Dir(0, 0, 1), math.radians(1))), " face (expected 1)")
+
+# An early break only creates the faces it has visited: finding the first face of a compound
+# with many faces must be much cheaper than getFaces()
+shapes = Topo.vector_ConstShape()
+for i in range(2000):
+    shapes.append(shape)
+compound = Topo.ShapeTool.makeCompound(shapes)
+
+start = time.perf_counter()
+it = Topo.FaceIterator(compound)
+first = it.next()
+breakTime = time.perf_counter() - start
+
+start = time.perf_counter()
+faces = Topo.ShapeTool.getFaces(compound)
+getFacesTime = time.perf_counter() - start
+print("early break: ", breakTime, "s, getFaces of ", len(faces), " faces: ", getFacesTime, "s, early break is cheaper: ",
+      breakTime < getFacesTime, " (expected True)")
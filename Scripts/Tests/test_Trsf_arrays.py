@@ -0,0 +1,29 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+##########################################################################
+
+def printPoints(text, points):
+    print(text, [(p.x(), p.y(), p.z()) for p in points])
+
+points = Geom.vector_Pnt()
+for i in range(5):
+    points.append(Geom.Pnt(i, 0, 0))
+
+t = Geom.Trsf()
+t.setTranslation(Geom.Vec(0, 10, 0))
+
+t.applyToArray(points)
+printPoints("applyToArray (y = 10): ", points)
+
+t.applyInverseToArray(points)
+printPoints("applyInverseToArray (y = 0): ", points)
+
+s = Geom.Trsf()
+s.setScale(Geom.Pnt(0, 0, 0), 2.0)
+t.applyMultipliedToArray(s, points)
+printPoints("applyMultipliedToArray (x doubled, y = 10): ", points)
+
+g = Geom.GTrsf()
+g.SetTrsf(t)
+g.ApplyInverseToArray(points)
+printPoints("GTrsf.ApplyInverseToArray (y = 0): ", points)
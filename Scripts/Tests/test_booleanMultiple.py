@@ -0,0 +1,35 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+##########################################################################
+doc   = lx.Application.getInstance().getActiveDocument()
+
+block = lx.Block.createIn(doc)
+block.setXLength(10)
+block.setYLength(10)
+block.setZLength(10)
+base = block.computeShape()
+
+small = lx.Block.createIn(doc)
+small.setXLength(1)
+small.setYLength(1)
+small.setZLength(20)
+tool = small.computeShape()
+
+tools = Topo.vector_ConstShape()
+for i in range(5):
+    tools.append(Topo.ShapeTool.moved(tool, Geom.XYZ(2 * i + 0.5, 5, -5)))
+tools.append(Topo.ShapeTool.moved(tool, Geom.XYZ(100, 100, 0)))  # does not overlap
+
+status = Base.vector_int()
+res = Topo.ShapeTool.booleanMultiple(Topo.BooleanOperation_CUT, base, tools, status)
+print("CUT: volume ", Topo.ShapeTool.getVolume(res), " (expected 950), status ", list(status))
+print("     APPLIED = ", Topo.BooleanToolStatus_APPLIED, ", SKIPPED_NO_OVERLAP = ", Topo.BooleanToolStatus_SKIPPED_NO_OVERLAP)
+
+res = Topo.ShapeTool.booleanMultiple(Topo.BooleanOperation_FUSE, base, tools, status)
+print("FUSE: volume ", Topo.ShapeTool.getVolume(res), ", status ", list(status))
+
+res = Topo.ShapeTool.booleanMultiple(Topo.BooleanOperation_COMMON, base, tools, status)
+print("COMMON with a tool outside: result is None: ", res is None, " (expected False), face count ", Topo.ShapeTool.getFaceCount(res), " (expected 0)")
+
+res = Topo.ShapeTool.booleanMultiple(Topo.BooleanOperation_CUT, None, tools, status)
+print("CUT with an invalid base: result is None: ", res is None, " (expected True)")
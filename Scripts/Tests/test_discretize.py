@@ -0,0 +1,31 @@
+import  Base, Core, Geom, Draw, Topo
+import  OpenLxApp as lx
+import  math
+##########################################################################
+
+arc = Topo.EdgeTool.makeArcOfCircle(Geom.Pnt(1, 0, 0), Geom.Pnt(math.sqrt(0.5), math.sqrt(0.5), 0), Geom.Pnt(0, 1, 0))
+line = Topo.EdgeTool.makeEdge(Geom.Pnt(0, 0, 0), Geom.Pnt(10, 0, 0))
+
+points = Geom.vector_Pnt()
+params = Base.vector_double()
+ok = Topo.EdgeTool.discretize(arc, 0.001, 0.1, 0.0, points, params)
+print("arc: ", ok, ", ", len(points), " points, ", len(params), " parameters")
+
+ok = Topo.EdgeTool.discretize(line, 0.001, 0.1, 0.0, points)
+print("straight edge without length limit: ", len(points), " points (expected 2)")
+ok = Topo.EdgeTool.discretize(line, 0.001, 0.1, 3.0, points)
+print("straight edge with maxSegmentLength 3: ", len(points), " points (expected 5)")
+
+# Many edges at once, one polyline per edge
+polylines = Geom.PointListSet()
+ok = Topo.EdgeTool.discretize(Topo.vector_ConstEdge([arc, line]), 0.001, 0.1, 0.0, polylines)
+print("two edges: ", ok, ", ", polylines.numLists(), " polylines with ", polylines.listSize(0), " and ", polylines.listSize(1), " points")
+
+wire = Topo.WireTool.makePolygon(Geom.vector_Pnt([Geom.Pnt(0, 0, 0), Geom.Pnt(10, 0, 0), Geom.Pnt(10, 5, 0)]))
+ok = Topo.WireTool.discretize(wire, 0.001, 0.1, 0.0, points)
+print("wire: ", ok, ", ", len(points), " points (expected 3, the shared vertex only once)")
+ok = Topo.WireTool.discretize(wire, points)
+print("wire with the default tolerances: ", ok, ", ", len(points), " points")
+
+ok = Topo.WireTool.discretize(Topo.vector_ConstWire([wire, wire]), 0.001, 0.1, 2.0, polylines)
+print("two wires with maxSegmentLength 2: ", ok, ", ", polylines.numLists(), " polylines, ", polylines.numPoints(), " points (expected 2, 18)")
@@ -40,6 +40,7 @@ class ObjectGraph;
 class ExecObject;
 class PropertyLinkBase;
 class CoreDocumentImpl;
+class DocSpatialIndex;
 class Transaction;
 class RelGraph;
 class PropertyLinkBaseBase;
@@ -412,6 +413,11 @@ public:
     Core::DocObject* createObjectFromType(Base::Type type);
     /// Returns all objects of typeName
     std::vector<Core::DocObject*> getObjectsByTypeName(const std::string& typeName) const;
+    /// Enables or disables the R-tree of object bounding boxes. The index is kept up to date on every recompute.
+    void setSpatialIndexEnabled(bool on);
+    bool isSpatialIndexEnabled() const;
+    /// Returns the spatial index, nullptr if it is not enabled
+    Core::DocSpatialIndex* getSpatialIndex() const;
     /// Recomputes the document
     virtual void recompute();
     /// Recomputes the document. Takes a lambda as an argument -> { /*CODE*/ auto onRecomputedCB = [this] (DOCOBJECTS newObj, DOCOBJECTS updatedObj,
@@ -0,0 +1,70 @@
+#pragma once
+
+#include <Base/Observer.h>
+#include <Geom/Bnd_Box.h>
+#include <Geom/RTree.h>
+
+#include <unordered_map>
+#include <vector>
+
+namespace Geom
+{
+class Pnt;
+}
+
+namespace Core
+{
+class CoreDocument;
+class DocChanges;
+class DocObject;
+
+/**
+ * @brief R-tree of the world bounding boxes of the objects of a document.
+ *
+ * The index is built once from all objects of the document that have a bounding box and
+ * is then kept up to date from the NewObjects, UpdatedObjects and DeletedObjects of every
+ * recompute (Core::DocChanges). Only changed objects are re-inserted, so queries stay
+ * cheap on large models without rescanning the whole document.
+ *
+ * The payload stored in the tree is the Core::DocObject*.
+ *
+ * @since    28.0
+ */
+class LX_CORE_EXPORT DocSpatialIndex : public Base::Observer<Core::DocChanges>
+{
+public:
+    /// Builds the index from 'aDoc' and attaches itself as observer of the document
+    explicit DocSpatialIndex(Core::CoreDocument* aDoc);
+    /// Detaches from the document
+    ~DocSpatialIndex() override;
+
+    DocSpatialIndex(const DocSpatialIndex&) = delete;
+    DocSpatialIndex& operator=(const DocSpatialIndex&) = delete;
+
+    /// Drops all entries and rebuilds the index from the current objects of the document (bulk load)
+    void rebuild();
+    /// Number of objects in the index
+    size_t size() const;
+
+    /// Objects whose world bounding box intersects 'aBox'
+    void queryIntersects(const Geom::Bnd_Box& aBox, std::vector<Core::DocObject*>& aResult) const;
+    /// The 'k' objects whose world bounding boxes are nearest to 'aPnt', sorted by increasing distance
+    void queryNearest(const Geom::Pnt& aPnt, int k, std::vector<Core::DocObject*>& aResult) const;
+
+    /// Applies the new, updated and deleted objects of a recompute
+    void onChange(Base::Subject<Core::DocChanges>* rCaller, Core::DocChanges rcReason) override;
+    /// Document is going away, the index is emptied
+    void onDestroy(Base::Subject<Core::DocChanges>& rCaller) override;
+    const char* name() override { return "DocSpatialIndex"; }
+
+private:
+    void insert(Core::DocObject* aObj);
+    void remove(Core::DocObject* aObj);
+
+    Core::CoreDocument* _doc = nullptr;
+    Geom::BoxRTree _tree;
+    // box under which each object is stored in '_tree', needed to remove it again
+    std::unordered_map<Core::DocObject*, Geom::Bnd_Box> _boxes;
+};
+
+}  // namespace Core
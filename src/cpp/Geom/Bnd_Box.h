@@ -20,6 +20,7 @@
 ///////////////////////////////////////////////////////////////////////
 
 #pragma once
+#include <cstdint>
 #include <vector>
 
 
@@ -259,6 +260,38 @@ public:
     //!    	    lines represented by their reference points <P1>, <P2> and <br>
     //!          direction <D> intersects the box. <br>
     unsigned int IsOut(const Geom::Pnt& P1, const Geom::Pnt& P2, const Geom::Dir& D) const;
+    //! Array version of IsOut(const Geom::Pnt&). Returns one entry <br>
+    //!          per point of <points>, 1 if the point is out of <me>, <br>
+    //!          0 otherwise. <br>
+    std::vector<int> IsOutPoints(const std::vector<Geom::Pnt>& points) const;
+    //! Array version of IsOut(const Geom::Bnd_Box&) for boxes given by <br>
+    //!          their min and max corners. Returns 1 for every box that <br>
+    //!          is out of <me>, 0 otherwise. <br>
+    std::vector<int> IsOutBoxes(const std::vector<Geom::Pnt>& minCorners, const std::vector<Geom::Pnt>& maxCorners) const;
+    //! Returns all pairs (i, j) for which box i of the first set <br>
+    //!          and box j of the second set intersect, as consecutive <br>
+    //!          entries i, j of the result. The boxes are enlarged by <gap>. <br>
+    //!          Uses a sort and sweep along the longest axis, the sweep <br>
+    //!          is split over several threads for large inputs. <br>
+    static std::vector<int> OverlappingPairs(const std::vector<Geom::Pnt>& minCornersA,
+                                             const std::vector<Geom::Pnt>& maxCornersA,
+                                             const std::vector<Geom::Pnt>& minCornersB,
+                                             const std::vector<Geom::Pnt>& maxCornersB,
+                                             double gap);
+#ifndef SWIG
+    //! Same as above for <count> points or boxes given as x,y,z <br>
+    //!          triplets. <outMask> must hold <count> entries. <br>
+    void IsOutPoints(const double* coords, int64_t count, unsigned char* outMask) const;
+    void IsOutBoxes(const double* minCorners, const double* maxCorners, int64_t count, unsigned char* outMask) const;
+    static void OverlappingPairs(const double* minCornersA,
+                                 const double* maxCornersA,
+                                 int64_t countA,
+                                 const double* minCornersB,
+                                 const double* maxCornersB,
+                                 int64_t countB,
+                                 double gap,
+                                 std::vector<int64_t>& pairs);
+#endif
     //! Computes the minimum distance between two boxes. <br>
     // Standard_EXPORT     double Distance(const Bnd_Box& Other) const;
 
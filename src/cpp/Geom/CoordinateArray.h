@@ -0,0 +1,75 @@
+#pragma once
+
+#include <Geom/Pnt.h>
+#include <Geom/Pnt2d.h>
+#include <Geom/Vec.h>
+#include <Geom/XYZ.h>
+#include <cstdint>
+#include <cstring>
+#include <type_traits>
+#include <vector>
+
+namespace Geom
+{
+/**
+ * @brief Flat access to the coordinates of point containers.
+ *
+ * Geom::Pnt, Geom::Vec and Geom::XYZ consist of exactly three doubles (Geom::Pnt2d of two),
+ * so a std::vector of them is one contiguous N x 3 (N x 2) block of doubles. data() returns
+ * that block without copying and assign() fills a vector from it with one memcpy.
+ * Geom::PointListSet uses it for its flat coordinate buffer. This is a C++ helper only;
+ * the Python vectors (vector_Pnt, ...) are not changed by it.
+ *
+ * The pointer returned by data() is only valid as long as the vector lives and is not resized.
+ *
+ * @since    28.0
+ */
+class CoordinateArray
+{
+public:
+    static_assert(std::is_standard_layout<Geom::XYZ>::value && sizeof(Geom::XYZ) == 3 * sizeof(double), "Geom::XYZ must be 3 doubles");
+    static_assert(std::is_standard_layout<Geom::Pnt>::value && sizeof(Geom::Pnt) == 3 * sizeof(double), "Geom::Pnt must be 3 doubles");
+    static_assert(std::is_standard_layout<Geom::Vec>::value && sizeof(Geom::Vec) == 3 * sizeof(double), "Geom::Vec must be 3 doubles");
+    static_assert(std::is_standard_layout<Geom::Pnt2d>::value && sizeof(Geom::Pnt2d) == 2 * sizeof(double), "Geom::Pnt2d must be 2 doubles");
+
+    /// Number of doubles per item (3 for Pnt, Vec and XYZ, 2 for Pnt2d)
+    template <class T>
+    static constexpr int64_t dimension()
+    {
+        return static_cast<int64_t>(sizeof(T) / sizeof(double));
+    }
+
+    /// Returns a pointer to the first coordinate of the first item. Returns nullptr if the vector is empty.
+    template <class T>
+    static double* data(std::vector<T>& items)
+    {
+        return items.empty() ? nullptr : reinterpret_cast<double*>(items.data());
+    }
+
+    /// Returns a pointer to the first coordinate of the first item. Returns nullptr if the vector is empty.
+    template <class T>
+    static const double* data(const std::vector<T>& items)
+    {
+        return items.empty() ? nullptr : reinterpret_cast<const double*>(items.data());
+    }
+
+    /// Replaces the content of 'items' with 'count' items read from 'coords' (count * dimension<T>() doubles).
+    template <class T>
+    static void assign(std::vector<T>& items, const double* coords, int64_t count)
+    {
+        items.resize(static_cast<size_t>(count));
+        if (count > 0)
+            std::memcpy(items.data(), coords, static_cast<size_t>(count) * sizeof(T));
+    }
+
+    /// Returns a new vector with 'count' items read from 'coords' (count * dimension<T>() doubles).
+    template <class T>
+    static std::vector<T> make(const double* coords, int64_t count)
+    {
+        std::vector<T> items;
+        assign(items, coords, count);
+        return items;
+    }
+};
+
+}  // namespace Geom
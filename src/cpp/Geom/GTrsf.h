@@ -180,6 +180,30 @@ public:
     //! Transforms a triplet XYZ with a GTrsf. <br>
     void Transforms(double& X, double& Y, double& Z) const;
 
+#ifndef SWIG
+    //! Transforms 'count' points stored as consecutive x,y,z triplets <br>
+    //! in 'coords' in place. Equivalent to calling Transforms() on every <br>
+    //! triplet, but done in one loop. <br>
+    void ApplyToArray(double* coords, int64_t count) const;
+    //! Same as above, but writes the transformed triplets to 'result' <br>
+    //! and leaves 'coords' untouched. 'result' must hold 3 * count doubles. <br>
+    void ApplyToArray(const double* coords, double* result, int64_t count) const;
+    //! Transforms the triplets in place with the inverse of this transformation. <br>
+    //! Raises an exception if the transformation is singular. <br>
+    void ApplyInverseToArray(double* coords, int64_t count) const;
+    void ApplyInverseToArray(const double* coords, double* result, int64_t count) const;
+    //! Transforms the triplets in place with <me> * T, i.e. first T and then <me>, <br>
+    //! without creating the composed transformation on the caller side. <br>
+    void ApplyMultipliedToArray(const Geom::GTrsf& T, double* coords, int64_t count) const;
+    void ApplyMultipliedToArray(const Geom::GTrsf& T, const double* coords, double* result, int64_t count) const;
+#endif
+    //! Transforms all points of 'points' in place in one loop. <br>
+    void ApplyToArray(std::vector<Geom::Pnt>& points) const;
+    //! Transforms all points of 'points' in place with the inverse of this transformation. <br>
+    void ApplyInverseToArray(std::vector<Geom::Pnt>& points) const;
+    //! Transforms all points of 'points' in place with <me> * T. <br>
+    void ApplyMultipliedToArray(const Geom::GTrsf& T, std::vector<Geom::Pnt>& points) const;
+
     Geom::Trsf Trsf(bool aAllowOtherFormInConstruction = false) const;
     // const Geom::Mat& _CSFDB_GetGTrsfmatrix() const { return matrix; }
     // const Geom::XYZ& _CSFDB_GetGTrsfloc() const { return loc; }
@@ -230,6 +230,60 @@ public:
     static GT_ProjectPointOnCircle1_Result projectPointOnCircle1(const Geom::Pnt& p, const Geom::Circ& circle);
     static GT_MakeAxisPlacementFrom2Points_Result makeAxisPlacementFrom2Points(const Geom::Pnt& p1, const Geom::Pnt& p2);
     //@}
+
+    /** @name Array interfaces
+     *  Work on many points at once and never throw: points that cannot be projected get NaN
+     *  coordinates and parameters. The overloads taking a std::vector return their results
+     *  (vector_Pnt and vector_double in Python).
+     */
+    //@{
+    static std::vector<Geom::Pnt> projectPointsOnPlane(const std::vector<Geom::Pnt>& points, const Geom::Pln& plane);
+    static std::vector<Geom::Pnt> projectPointsOnLine(const std::vector<Geom::Pnt>& points, const Geom::Lin& line);
+    static std::vector<Geom::Pnt> projectPointsOnCircle(const std::vector<Geom::Pnt>& points, const Geom::Circ& circle);
+    static std::vector<double> getSignedDistancesFromPointsToPlane(const std::vector<Geom::Pnt>& points, const Geom::Pln& plane);
+    static std::vector<double> getDistancesFromPointsToLine(const std::vector<Geom::Pnt>& points, const Geom::Lin& line);
+    static std::vector<double> getDistancesFromPointsToPoint(const std::vector<Geom::Pnt>& points, const Geom::Pnt& p);
+    /// Pairwise distances between the i-th point of 'points1' and the i-th point of 'points2' (same size)
+    static std::vector<double> getDistancesBetweenPoints(const std::vector<Geom::Pnt>& points1, const std::vector<Geom::Pnt>& points2);
+    /// Returns the index of the point in 'points' closest to 'pnt', -1 if 'points' is empty
+    static int findClosestPointIndex(const Geom::Pnt& pnt, const std::vector<Geom::Pnt>& points);
+
+#ifndef SWIG
+    /// Same as above for 'count' consecutive x,y,z triplets. Output buffers are allocated by the
+    /// caller; pass nullptr for outputs that are not needed.
+    static void projectPointsOnPlane(const double* coords, int64_t count, const Geom::Pln& plane, double* projected, double* U = nullptr, double* V = nullptr);
+    static void projectPointsOnLine(const double* coords, int64_t count, const Geom::Lin& line, double* projected, double* U = nullptr);
+    static void projectPointsOnCircle(const double* coords, int64_t count, const Geom::Circ& circle, double* projected, double* U = nullptr);
+    static void getSignedDistancesFromPointsToPlane(const double* coords, int64_t count, const Geom::Pln& plane, double* distances);
+    static void getDistancesFromPointsToLine(const double* coords, int64_t count, const Geom::Lin& line, double* distances);
+    static void getDistancesFromPointsToPoint(const double* coords, int64_t count, const Geom::Pnt& p, double* distances);
+    /// Pairwise distances between the i-th point of 'coords1' and the i-th point of 'coords2'
+    static void getDistancesBetweenPoints(const double* coords1, const double* coords2, int64_t count, double* distances);
+    /// Returns the index of the point in 'coords' closest to 'pnt', -1 if count is 0
+    static int64_t findClosestPointIndex(const Geom::Pnt& pnt, const double* coords, int64_t count);
+#endif
+    /// Boxes are given by their min and max corners. Returns 1 for every box intersected by 'plane', 0 otherwise
+    static std::vector<int> intersectBBoxesWithPlane(const std::vector<Geom::Pnt>& minCorners, const std::vector<Geom::Pnt>& maxCorners, const Geom::Pln& plane);
+    /// Returns 1 for every box intersected by 'lin', 0 otherwise. 'pnear' and 'pfar' get the entry and exit points (NaN if not hit)
+    static std::vector<int> intersectLineWithBBoxes(const Geom::Lin& lin,
+                                                    const std::vector<Geom::Pnt>& minCorners,
+                                                    const std::vector<Geom::Pnt>& maxCorners,
+                                                    std::vector<Geom::Pnt>& pnear,
+                                                    std::vector<Geom::Pnt>& pfar,
+                                                    double epsilon = 0.0);
+#ifndef SWIG
+    /// Same as above for 'count' boxes given as x,y,z triplets. 'hitMask' must hold 'count' entries, 'pnear' and 'pfar' are optional
+    static void intersectBBoxesWithPlane(const double* minCorners, const double* maxCorners, int64_t count, const Geom::Pln& plane, unsigned char* hitMask);
+    static void intersectLineWithBBoxes(const Geom::Lin& lin,
+                                        const double* minCorners,
+                                        const double* maxCorners,
+                                        int64_t count,
+                                        unsigned char* hitMask,
+                                        double* pnear = nullptr,
+                                        double* pfar = nullptr,
+                                        double epsilon = 0.0);
+#endif
+    //@}
 };
 
 }  // namespace Geom
@@ -0,0 +1,127 @@
+#pragma once
+
+#include <Base/String.h>
+#include <Geom/LODGrid.h>
+
+#include <atomic>
+#include <functional>
+#include <future>
+#include <memory>
+#include <string>
+#include <vector>
+
+namespace Base { class Color; }
+
+namespace Geom
+{
+/**
+ * @brief Builds a Geom::LODGrid from a point file.
+ *
+ * The file is memory-mapped and split into chunks of chunkSize() points. The chunks
+ * are processed by a pool of threads in three passes over the mapped file:
+ *
+ * 1. bounding box of all points (one box per chunk, merged at the end),
+ * 2. LODGrid::addCoordinate_Pass1() - the cells are counted in a grid per thread which
+ *    are summed up before LODGrid::createLUT(),
+ * 3. LODGrid::addCoordinate_Pass2() - the points are distributed to the LODNodes, which
+ *    are locked per node.
+ *
+ * LODGrid::shuffle() is called at the end. The points are never copied into an
+ * intermediate buffer, so the memory needed is the memory of the resulting nodes.
+ *
+ * Text files have one point per line ("x y z" or "x y z r g b", separated by blanks,
+ * commas or semicolons). Binary files are a plain sequence of records: three float64
+ * (XYZ_BINARY) or three float64 followed by one uint32 color 0xRRGGBBAA (XYZRGB_BINARY).
+ * The progress is reported by getProgress(), which can be polled from another thread (e.g. by a
+ * script which started the build with startBuildToFile()), and in C++ also by a progress
+ * callback which is called from the building thread.
+ *
+ * @since    28.0
+ */
+class LX_GEOM_EXPORT LODGridBuilder
+{
+public:
+    enum class PointFileFormat
+    {
+        XYZ_TEXT,
+        XYZRGB_TEXT,
+        XYZ_BINARY,
+        XYZRGB_BINARY
+    };
+
+    explicit LODGridBuilder(uint64_t gridSize = 128);
+    ~LODGridBuilder();
+
+    LODGridBuilder(const LODGridBuilder&) = delete;
+    LODGridBuilder& operator=(const LODGridBuilder&) = delete;
+
+    /// Number of points per chunk. Default is 1'000'000.
+    void setChunkSize(int64_t points);
+    int64_t getChunkSize() const;
+    /// Number of worker threads. 0 (default) uses std::thread::hardware_concurrency().
+    void setThreadCount(int threads);
+    int getThreadCount() const;
+#ifndef SWIG
+    /// Called with the total progress in percent (0..100)
+    void setProgressCallback(std::function<void(int done_in_percent)> callback);
+#endif
+    /// Total progress of the running or last build in percent (0..100). Thread safe.
+    int getProgress() const;
+    /// Requests the running build() to stop after the current chunks
+    void cancel();
+    bool isCancelled() const;
+
+#ifndef SWIG
+    /// Reads 'fileName' and builds the grid. Returns nullptr if the file cannot be read or the build was cancelled.
+    std::unique_ptr<Geom::LODGrid> build(const Base::String& fileName, PointFileFormat format);
+#endif
+    /// build() followed by write(). Returns false if either fails.
+    bool buildToFile(const Base::String& pointFileName, PointFileFormat format, const Base::String& lodFileName);
+    /// Number of points read by the last build(), lines that could not be parsed are skipped
+    int64_t getNumPointsRead() const;
+
+    /** @name Background build
+     *  buildToFile() in a worker thread, so the caller can poll getProgress() and cancel().
+     */
+    //@{
+    /// Starts buildToFile() in a worker thread. Returns false if a background build is already running.
+    bool startBuildToFile(const Base::String& pointFileName, PointFileFormat format, const Base::String& lodFileName);
+    /// Returns true while the background build is running
+    bool isRunning() const;
+    /// Waits for the background build and returns its result. Returns false if none was started.
+    bool wait();
+    //@}
+
+#ifndef SWIG
+    /**
+     * Writes the LOD hierarchy of 'grid' to 'fileName': a header with the grid parameters,
+     * a table with id, level, position, size, number of points and file offset of every node,
+     * followed by the points and colors of the nodes.
+     */
+    static bool write(const Geom::LODGrid& grid, const Base::String& fileName);
+    /**
+     * Reads a grid written by write(). With 'loadPoints' = false only the node table is read
+     * and the nodes have no points; they can be loaded one by one with readNodePoints()
+     * when they are displayed.
+     */
+    static std::unique_ptr<Geom::LODGrid> read(const Base::String& fileName, bool loadPoints = false);
+    /// Reads the points and colors of 'node' from a file written by write()
+    static bool readNodePoints(const Base::String& fileName, Geom::LODNode& node);
+#endif
+    /// Ids of the nodes of a file written by write(), in the order of its node table. Empty if the file cannot be read.
+    static std::vector<std::string> readNodeIds(const Base::String& fileName);
+    /// Reads the points and colors of the node 'nodeId' from a file written by write(). Returns false if there is no such node.
+    static bool readNodePoints(const Base::String& fileName, const std::string& nodeId, std::vector<Geom::Pnt>& points, std::vector<Base::Color>& colors);
+
+private:
+    uint64_t _gridSize;
+    int64_t _chunkSize = 1'000'000;
+    int _threadCount = 0;
+    int64_t _numPointsRead = 0;
+    std::atomic<bool> _cancelled{false};
+    std::atomic<int> _progress{0};
+    std::function<void(int)> _progressCallback;
+    std::future<bool> _backgroundBuild;
+};
+
+}  // namespace Geom
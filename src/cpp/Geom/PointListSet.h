@@ -0,0 +1,159 @@
+#pragma once
+
+#include <Geom/CoordinateArray.h>
+#include <Geom/Pnt.h>
+#include <Geom/Pnt2d.h>
+#include <stdexcept>
+#include <vector>
+
+namespace Geom
+{
+/**
+ * @brief A set of point lists (polylines, loops, defect polygons) in compressed form.
+ *
+ * All points are stored in one contiguous vector and list i consists of the points
+ * [offset(i), offset(i + 1)). Compared to std::vector<std::vector<T>> there is only one
+ * allocation for the points and one for the offsets, regardless of the number of lists.
+ *
+ * The accessors taking a list or point index throw std::out_of_range (IndexError in Python)
+ * if the index is out of range.
+ *
+ * Use PointListSet for Geom::Pnt and PointListSet2d for Geom::Pnt2d.
+ *
+ * @since    28.0
+ */
+template <class T>
+class BasicPointListSet
+{
+public:
+    BasicPointListSet() : _offsets(1, 0) {}
+    /// Builds the set from nested vectors
+    explicit BasicPointListSet(const std::vector<std::vector<T>>& lists) : _offsets(1, 0) { assign(lists); }
+
+    /// Number of lists
+    int64_t numLists() const { return static_cast<int64_t>(_offsets.size()) - 1; }
+    /// Total number of points in all lists
+    int64_t numPoints() const { return static_cast<int64_t>(_points.size()); }
+    /// Number of points in list 'i'
+    int64_t listSize(int64_t i) const
+    {
+        _checkList(i);
+        return _offsets[i + 1] - _offsets[i];
+    }
+    /// Index of the first point of list 'i' in points(). offset(numLists()) == numPoints().
+    int64_t offset(int64_t i) const
+    {
+        if (i < 0 || i > numLists())
+            throw std::out_of_range("PointListSet: offset index out of range");
+        return _offsets[i];
+    }
+    bool empty() const { return _offsets.size() == 1; }
+
+    void clear()
+    {
+        _points.clear();
+        _offsets.assign(1, 0);
+    }
+    void reserve(int64_t lists, int64_t points)
+    {
+        _offsets.reserve(static_cast<size_t>(lists) + 1);
+        _points.reserve(static_cast<size_t>(points));
+    }
+
+    /// Appends a list
+    void addList(const std::vector<T>& list)
+    {
+        _points.insert(_points.end(), list.begin(), list.end());
+        _offsets.push_back(numPoints());
+    }
+#ifndef SWIG
+    /// Appends a list of 'count' points read from 'coords' (count * CoordinateArray::dimension<T>() doubles)
+    void addList(const double* coords, int64_t count)
+    {
+        const T* first = reinterpret_cast<const T*>(coords);
+        _points.insert(_points.end(), first, first + count);
+        _offsets.push_back(numPoints());
+    }
+#endif
+
+    /// Returns a copy of list 'i'
+    std::vector<T> getList(int64_t i) const
+    {
+        _checkList(i);
+        return std::vector<T>(_points.begin() + _offsets[i], _points.begin() + _offsets[i + 1]);
+    }
+    /// Returns point 'j' of list 'i'
+    const T& getPoint(int64_t i, int64_t j) const
+    {
+        _checkList(i);
+        if (j < 0 || j >= _offsets[i + 1] - _offsets[i])
+            throw std::out_of_range("PointListSet: point index out of range");
+        return _points[_offsets[i] + j];
+    }
+
+    /// All points of all lists
+    const std::vector<T>& points() const { return _points; }
+#ifndef SWIG
+    std::vector<T>& points() { return _points; }
+    /// numLists() + 1 offsets into points(), the first one is always 0
+    const std::vector<int64_t>& offsets() const { return _offsets; }
+#endif
+
+    /// Replaces the content with nested vectors
+    void assign(const std::vector<std::vector<T>>& lists)
+    {
+        size_t total = 0;
+        for (const auto& list : lists)
+            total += list.size();
+
+        clear();
+        reserve(static_cast<int64_t>(lists.size()), static_cast<int64_t>(total));
+        for (const auto& list : lists)
+            addList(list);
+    }
+#ifndef SWIG
+    /// Replaces the content with 'numPoints' points read from 'coords' and 'numLists' + 1 offsets.
+    /// The offsets must start with 0, be increasing and end with 'numPoints'. Returns false (and leaves the set unchanged) otherwise.
+    bool assign(const double* coords, int64_t numPoints, const int64_t* offsets, int64_t numLists)
+    {
+        if (numLists < 0 || offsets[0] != 0 || offsets[numLists] != numPoints)
+            return false;
+        for (int64_t i = 0; i < numLists; ++i)
+        {
+            if (offsets[i] > offsets[i + 1])
+                return false;
+        }
+
+        CoordinateArray::assign(_points, coords, numPoints);
+        _offsets.assign(offsets, offsets + numLists + 1);
+        return true;
+    }
+#endif
+
+    /// Converts to nested vectors
+    std::vector<std::vector<T>> toVectors() const
+    {
+        std::vector<std::vector<T>> lists;
+        lists.reserve(static_cast<size_t>(numLists()));
+        for (int64_t i = 0; i < numLists(); ++i)
+            lists.push_back(getList(i));
+        return lists;
+    }
+
+    bool operator==(const BasicPointListSet& other) const { return _offsets == other._offsets && _points == other._points; }
+
+private:
+    void _checkList(int64_t i) const
+    {
+        if (i < 0 || i >= numLists())
+            throw std::out_of_range("PointListSet: list index out of range");
+    }
+
+    std::vector<T> _points;
+    std::vector<int64_t> _offsets;
+};
+
+typedef BasicPointListSet<Geom::Pnt> PointListSet;
+typedef BasicPointListSet<Geom::Pnt2d> PointListSet2d;
+
+}  // namespace Geom
@@ -27,6 +27,36 @@ public:
     int64_t addPointIfNotExistsVoidPtr(const Geom::Pnt& p, void* userData);
     void removePoint(const int64_t idx);
 
+    /// Batch version of addPointIfNotExists(). Returns one entry per input point: the index in this map
+    /// of the point it was welded to. The user data of newly added points is the index of the input point.
+    ///
+    /// The result is the same as calling addPointIfNotExists() for the points in input order, up to the
+    /// choice of the representative if several are within the tolerance:
+    /// - a point within the tolerance of a point already in the map is welded to that point,
+    /// - otherwise it is welded to an earlier input point within the tolerance which was added to the map,
+    /// - otherwise it is added to the map.
+    ///
+    /// The points are sorted into a grid with the tolerance as cell size, so all points within the tolerance
+    /// of a point lie in its own cell or in one of the 26 neighbouring cells, also across cell boundaries.
+    /// The search for the map points and the earlier input points within the tolerance runs in parallel.
+    /// The remaining decision (added or welded) is then made in input order, so the result is the same for
+    /// every thread count.
+    std::vector<int> addPointsIfNotExist(const std::vector<Geom::Pnt>& points);
+    /// Returns all points of the map
+    std::vector<Geom::Pnt> getPoints() const;
+
+    /// Convenience: welds 'points' within 'tol' in one call, with the same rules as addPointsIfNotExist() on an empty map.
+    /// 'remap' gets one entry per input point (index into 'uniquePoints').
+    static void weldPoints(const std::vector<Geom::Pnt>& points, double tol, std::vector<int>& remap, std::vector<Geom::Pnt>& uniquePoints);
+
+#ifndef SWIG
+    /// Same as above for 'count' points given as x,y,z triplets in 'coords'. 'remap' must hold 'count' entries.
+    void addPointsIfNotExist(const double* coords, int64_t count, int64_t* remap);
+    /// Copies all points of the map as x,y,z triplets to 'coords', which must hold 3 * numPoints() doubles
+    void getPoints(double* coords) const;
+    static void weldPoints(const double* coords, int64_t count, double tol, std::vector<int64_t>& remap, std::vector<Geom::Pnt>& uniquePoints);
+#endif
+
     bool operator==(const PointMapWithTolerance& other) const;
 
 private:
@@ -6,6 +6,8 @@
 #include <Geom/Bnd_Box.h>
 
 #include <deque>
+#include <functional>
+#include <memory>
 #include <concurrent_vector.h>
 
 struct FloatPoint
@@ -21,6 +23,7 @@ struct FloatPoint
 namespace Geom
 {
 class QuadTree;
+class QuadTreePager;
 
 class QuadTreeIterator
 {
@@ -82,6 +85,7 @@ public:
     bool insert(const Geom::ColorPoint& cp);
 
     const Geom::Rect& getBoundary() const;
+    /// Points of a resident node (isResident()). Empty for a leaf spilled to the page file, use copyPoints() there.
     const std::deque<Geom::ColorPoint>& getPoints() const;
     const bool hasPoints() const;
     const size_t getPointCount() const;
@@ -97,6 +101,31 @@ public:
     void setDeep(int deep);
     int getDeep();
 
+    /** @name Out-of-core mode
+     *  With a Geom::QuadTreePager the points of large leaves are moved to a page file and
+     *  mapped back on demand. getPoints() only returns the points of resident nodes.
+     *  copyPoints() and getPointsRecursive() also load the spilled points; queryRange() and
+     *  queryNearest() stream the points leaf by leaf instead.
+     *  The pager added data members to QuadTree, so code compiled against an older version of
+     *  this header must be recompiled.
+     *  @since    28.0
+     */
+    //@{
+    /// Sets the pager of this node and all its children. Must be set before the first insert().
+    void setPager(std::shared_ptr<Geom::QuadTreePager> pager);
+    std::shared_ptr<Geom::QuadTreePager> getPager() const;
+    /// Returns false if the points of this node are in the page file and not mapped
+    bool isResident() const;
+    /// Copy of the points of this node, resident or not. A spilled leaf is pinned in the pager while it is copied.
+    std::deque<Geom::ColorPoint> copyPoints() const;
+    /// Calls 'visitor' for every point inside 'range' until it returns false. Returns the number of points visited.
+    size_t queryRange(const Geom::Rect& range, const std::function<bool(const Geom::ColorPoint&)>& visitor) const;
+    /// Points inside 'range'
+    void queryRange(const Geom::Rect& range, std::vector<Geom::ColorPoint>& result) const;
+    /// The 'k' points nearest to 'p' in XY, sorted by increasing distance. Visits the leaves nearest first and stops as soon as no closer leaf can exist.
+    void queryNearest(const Geom::Pnt& p, size_t k, std::vector<Geom::ColorPoint>& result) const;
+    //@}
+
 
     // Children
     QuadTree* northWest;
@@ -129,6 +158,10 @@ private:
     size_t _pointCount;
 
     bool _autoSplit;
+
+    // Out-of-core mode: page of the spilled points in the page file, -1 if resident
+    std::shared_ptr<Geom::QuadTreePager> _pager;
+    int64_t _pageId = -1;
 };
 
 
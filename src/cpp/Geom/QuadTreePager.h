@@ -0,0 +1,75 @@
+#pragma once
+
+#include <Base/String.h>
+
+#include <cstdint>
+#include <memory>
+
+namespace Geom
+{
+class ColorPoint;
+class QuadTree;
+class QuadTreePagerP;
+
+/**
+ * @brief Disk backing store for the points of a Geom::QuadTree (out-of-core mode).
+ *
+ * A QuadTree with a pager keeps the points of a leaf in memory until the leaf holds more
+ * than getLeafBudget() points. Then the points are appended to a memory-mapped page file and
+ * the in-memory storage of the leaf is released. Spilled leaves are mapped back on demand and
+ * kept in an LRU cache which holds at most getCacheBudget() points; the least recently used
+ * leaves are unmapped when the budget is exceeded.
+ *
+ * One pager is shared by all nodes of a tree (QuadTree::setPager() passes it on to the children).
+ * All functions are thread safe.
+ *
+ * @since    28.0
+ */
+class LX_GEOM_EXPORT QuadTreePager
+{
+public:
+    /**
+     * 'fileName' is the page file, it is created or truncated. With 'keepFile' = false the file
+     * is deleted when the pager is destroyed.
+     */
+    QuadTreePager(const Base::String& fileName, size_t leafBudget = 100'000, size_t cacheBudget = 10'000'000, bool keepFile = false);
+    ~QuadTreePager();
+
+    QuadTreePager(const QuadTreePager&) = delete;
+    QuadTreePager& operator=(const QuadTreePager&) = delete;
+
+    const Base::String& getFileName() const;
+    /// Number of points a leaf holds in memory before it is spilled
+    size_t getLeafBudget() const;
+    /// Maximal number of spilled points that are mapped at the same time
+    size_t getCacheBudget() const;
+    void setCacheBudget(size_t points);
+
+    /// Number of points currently held in memory by spilled leaves
+    size_t getResidentPointCount() const;
+    /// Number of points written to the page file
+    size_t getSpilledPointCount() const;
+    /// Number of requests for spilled leaves that were served from the cache
+    uint64_t getCacheHits() const;
+    /// Number of requests for spilled leaves that had to be mapped from the page file
+    uint64_t getCacheMisses() const;
+
+    /// Writes all pending pages and unmaps all leaves that are not in use
+    void flush();
+
+private:
+    friend class QuadTree;
+
+    /// Appends 'count' points to the page file, returns the page id
+    int64_t spill(const Geom::ColorPoint* points, size_t count);
+    /// Appends 'count' points to page 'pageId' (the page may be relocated)
+    void append(int64_t pageId, const Geom::ColorPoint* points, size_t count);
+    /// Maps page 'pageId' and marks it as most recently used. The pointer is valid until unpin() is called.
+    const Geom::ColorPoint* pin(int64_t pageId, size_t& count);
+    void unpin(int64_t pageId);
+    void release(int64_t pageId);
+
+    std::shared_ptr<Geom::QuadTreePagerP> mPimpl;
+};
+
+}  // namespace Geom
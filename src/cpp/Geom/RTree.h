@@ -1,14 +1,18 @@
 #pragma once
 
 #include <Geom/Bnd_Box.h>
+#ifndef SWIG
 #include <boost/geometry/index/rtree.hpp>
+#endif
 
 
 namespace Geom
 {
+class Dir;
 class Pnt;
 class Pnt2d;
 
+#ifndef SWIG
 namespace RTree
 {
     // Convenient namespaces
@@ -58,6 +62,7 @@ namespace RTree
     LX_GEOM_EXPORT Box2dValue getBox2dValue(const double& minx, const double& miny, const double& maxx, const double& maxy, uintptr_t userData);
     LX_GEOM_EXPORT Box2dValue getBox2dValue(const Geom::Bnd_Box& bbox, uintptr_t userData);
 }  // namespace RTree
+#endif
 
 
 class LX_GEOM_EXPORT BoxRTree
@@ -70,16 +75,49 @@ public:
     };
 
     BoxRTree();
+#ifndef SWIG
     BoxRTree(const std::vector<Value>& values);  // building of tree is faster with this constructor
+    // Bulk loading from arrays: 'minCorners' and 'maxCorners' hold 'count' x,y,z triplets, 'userData' holds 'count' payloads
+    BoxRTree(const double* minCorners, const double* maxCorners, const uintptr_t* userData, int64_t count);
+#endif
+    // Bulk loading, one box (min and max corner) and one payload per index. Payloads are ints in this interface.
+    BoxRTree(const std::vector<Geom::Pnt>& minCorners, const std::vector<Geom::Pnt>& maxCorners, const std::vector<int>& userData);
     BoxRTree(const BoxRTree& other);             // copy constructor
     ~BoxRTree();
 
+    void clear();
+    size_t size() const;
+    bool empty() const;
+    Bnd_Box bounds() const;                           // box around all values, void if the tree is empty
+    bool hasIntersection(const Bnd_Box& bbox) const;  // has at least one intersection
+
+    // Interface with int payloads (e.g. indices or element ids). The functions work like the uintptr_t versions below
+    // and return vector_int in Python. They have their own names, so the overloads of the uintptr_t interface are unchanged.
+    // Do not mix the two interfaces on the same tree: payloads which do not fit into an int are truncated.
+    void insertIndex(const Bnd_Box& bbox, int userData);
+    bool removeIndex(const Bnd_Box& bbox, int userData);  // removes only one value from the container
+    std::vector<int> queryIntersectsIndices(const Bnd_Box& bbox) const;
+    std::vector<int> queryNearestIndices(const Geom::Pnt& p, int k) const;
+    std::vector<int> queryWithinDistanceIndices(const Geom::Pnt& p, double distance) const;
+    std::vector<int> querySegmentIndices(const Geom::Pnt& p1, const Geom::Pnt& p2) const;
+    std::vector<int> queryRayIndices(const Geom::Pnt& origin, const Geom::Dir& dir, double maxLength) const;
+
+#ifndef SWIG
     void insert(const Bnd_Box& bbox, uintptr_t userData);
     void insert(const Value& value);
     bool remove(const Bnd_Box& bbox, uintptr_t userData);  // removes only one value from the container
     bool remove(const Value& value);                       // removes only one value from the container
 
     void queryIntersects(const Bnd_Box& bbox, std::vector<uintptr_t>& userDataVec) const;
+    // the k values nearest to 'p' (distance to the box, 0 if 'p' is inside), sorted by increasing distance
+    void queryNearest(const Geom::Pnt& p, int k, std::vector<uintptr_t>& userDataVec) const;
+    // all values whose box is not farther than 'distance' from 'p'
+    void queryWithinDistance(const Geom::Pnt& p, double distance, std::vector<uintptr_t>& userDataVec) const;
+    // all values whose box is hit by the segment p1-p2, sorted by increasing distance from p1
+    void querySegment(const Geom::Pnt& p1, const Geom::Pnt& p2, std::vector<uintptr_t>& userDataVec) const;
+    // all values whose box is hit by the ray starting at 'origin' in direction 'dir', up to 'maxLength', sorted by increasing distance
+    void queryRay(const Geom::Pnt& origin, const Geom::Dir& dir, double maxLength, std::vector<uintptr_t>& userDataVec) const;
+#endif
 
 private:
     RTree::BoxRTree* _tree;
@@ -96,10 +134,32 @@ public:
     };
 
     Box2dRTree();
+#ifndef SWIG
     Box2dRTree(const std::vector<Value>& values);  // building of tree is faster with this constructor
+    // Bulk loading from arrays: 'minCorners' and 'maxCorners' hold 'count' x,y pairs, 'userData' holds 'count' payloads
+    Box2dRTree(const double* minCorners, const double* maxCorners, const uintptr_t* userData, int64_t count);
+#endif
+    // Bulk loading, one box (min and max corner) and one payload per index. Payloads are ints in this interface.
+    Box2dRTree(const std::vector<Geom::Pnt2d>& minCorners, const std::vector<Geom::Pnt2d>& maxCorners, const std::vector<int>& userData);
     Box2dRTree(const Box2dRTree& other);           // copy constructor
     ~Box2dRTree();
 
+    void clear();
+    size_t size() const;
+    bool empty() const;
+    bool hasIntersection(const Bnd_Box& bbox) const;  // has at least one intersection
+
+    // Interface with int payloads (e.g. indices or element ids). The functions work like the uintptr_t versions below
+    // and return vector_int in Python. They have their own names, so the overloads of the uintptr_t interface are unchanged.
+    // Do not mix the two interfaces on the same tree: payloads which do not fit into an int are truncated.
+    void insertIndex(const Bnd_Box& bbox, int userData);
+    bool removeIndex(const Bnd_Box& bbox, int userData);  // removes only one value from the container
+    std::vector<int> queryIntersectsIndices(const Bnd_Box& bbox) const;
+    std::vector<int> queryNearestIndices(const Geom::Pnt2d& p, int k) const;
+    std::vector<int> queryWithinDistanceIndices(const Geom::Pnt2d& p, double distance) const;
+    std::vector<int> querySegmentIndices(const Geom::Pnt2d& p1, const Geom::Pnt2d& p2) const;
+
+#ifndef SWIG
     void insert(const Bnd_Box& bbox, uintptr_t userData);
     void insert(const Value& value);
     bool remove(const Bnd_Box& bbox, uintptr_t userData);  // removes only one value from the container
@@ -107,8 +167,14 @@ public:
 
     void queryIntersects(const Bnd_Box& bbox, std::vector<uintptr_t>& userDataVec) const;
     void queryIntersects(const RTree::Box2d& bbox, std::vector<uintptr_t>& userDataVec) const;
-    bool hasIntersection(const Bnd_Box& bbox) const;       // has at least one intersection
     bool hasIntersection(const RTree::Box2d& bbox) const;  // has at least one intersection
+    // the k values nearest to 'p', sorted by increasing distance
+    void queryNearest(const Geom::Pnt2d& p, int k, std::vector<uintptr_t>& userDataVec) const;
+    // all values whose box is not farther than 'distance' from 'p'
+    void queryWithinDistance(const Geom::Pnt2d& p, double distance, std::vector<uintptr_t>& userDataVec) const;
+    // all values whose box is hit by the segment p1-p2, sorted by increasing distance from p1
+    void querySegment(const Geom::Pnt2d& p1, const Geom::Pnt2d& p2, std::vector<uintptr_t>& userDataVec) const;
+#endif
 
 private:
     RTree::Box2dRTree* _tree;
@@ -23,6 +23,9 @@
 
 #include <Geom/Mat.h>
 #include <Geom/XYZ.h>
+
+#include <cstdint>
+#include <vector>
 namespace Base { class Matrix4D; }
 
 namespace Geom
@@ -335,6 +338,30 @@ public:
 
     void toMatrix4D(Base::Matrix4D& mtrx);
 
+#ifndef SWIG
+    //! Transforms 'count' points stored as consecutive x,y,z triplets <br>
+    //! in 'coords' in place. Equivalent to calling transforms() on every <br>
+    //! triplet, but done in one loop. <br>
+    void applyToArray(double* coords, int64_t count) const;
+    //! Same as above, but writes the transformed triplets to 'result' <br>
+    //! and leaves 'coords' untouched. 'result' must hold 3 * count doubles. <br>
+    void applyToArray(const double* coords, double* result, int64_t count) const;
+    //! Transforms the triplets in place with the inverse of this transformation. <br>
+    //! Raises ConstructionError if the transformation is not inversible. <br>
+    void applyInverseToArray(double* coords, int64_t count) const;
+    void applyInverseToArray(const double* coords, double* result, int64_t count) const;
+    //! Transforms the triplets in place with <me> * T, i.e. first T and then <me>, <br>
+    //! without creating the composed transformation on the caller side. <br>
+    void applyMultipliedToArray(const Trsf& T, double* coords, int64_t count) const;
+    void applyMultipliedToArray(const Trsf& T, const double* coords, double* result, int64_t count) const;
+#endif
+    //! Transforms all points of 'points' in place in one loop. <br>
+    void applyToArray(std::vector<Geom::Pnt>& points) const;
+    //! Transforms all points of 'points' in place with the inverse of this transformation. <br>
+    void applyInverseToArray(std::vector<Geom::Pnt>& points) const;
+    //! Transforms all points of 'points' in place with <me> * T. <br>
+    void applyMultipliedToArray(const Trsf& T, std::vector<Geom::Pnt>& points) const;
+
     friend class gp_GTrsf;
     friend class Geom::GTrsf;
 
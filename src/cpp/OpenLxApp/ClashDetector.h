@@ -0,0 +1,116 @@
+#pragma once
+
+#include <LxIfc4/IFC4_impl/LxIfc4EntityEnums.h>
+#include <Topo/Clash.h>
+
+#include <memory>
+#include <vector>
+
+namespace Topo
+{
+class MainThreadCallback;
+}
+
+namespace OpenLxApp
+{
+class Document;
+struct DocumentChanges;
+class Element;
+class ClashDetectorP;
+
+/**
+ * @brief One clash found by the OpenLxApp::ClashDetector.
+ *
+ * @ingroup OPENLX_FRAMEWORK
+ * @since    28.0
+ */
+struct LX_OPENLXAPP_EXPORT ClashResult
+{
+    std::shared_ptr<OpenLxApp::Element> First;
+    std::shared_ptr<OpenLxApp::Element> Second;
+    Topo::BodyClashType ClashType = Topo::BodyClashType::CLASH_UNKNOWN;
+};
+
+/**
+ * @brief Clash detection over all elements of a document or between two groups of elements.
+ *
+ * The detection runs in two phases:
+ * - Broad phase: the world bounding boxes of the elements (enlarged by the tolerance) are
+ *   put in an R-tree and only pairs with overlapping boxes are kept. Pairs excluded by
+ *   the type and layer rules are dropped here.
+ * - Narrow phase: Topo::ShapeTool::clashBodies() with the clash mode is run on the
+ *   remaining pairs on the kernel thread pool.
+ *
+ * With setIncremental(true) the detector observes the document and remembers the
+ * elements of every recompute (new, modified, deleted). update() then only re-checks
+ * these elements against their neighbours and keeps all other results.
+ *
+ * @ingroup OPENLX_FRAMEWORK
+ * @since    28.0
+ */
+class LX_OPENLXAPP_EXPORT ClashDetector
+{
+public:
+    explicit ClashDetector(std::shared_ptr<OpenLxApp::Document> aDoc);
+    ~ClashDetector();
+
+    ClashDetector(const ClashDetector&) = delete;
+    ClashDetector& operator=(const ClashDetector&) = delete;
+
+    /** @name Settings */
+    //@{
+    /// Default is Topo::ClashMode::CLASH_CLASSIFY_BODIES
+    void setClashMode(Topo::ClashMode aMode);
+    Topo::ClashMode getClashMode() const;
+    /// Elements closer than 'aTolerance' are reported as clashing (CLASH_ABUTS). Default is 0.
+    void setTolerance(double aTolerance);
+    double getTolerance() const;
+    /// Checks 'aGroupA' against 'aGroupB' only. By default all elements of the document are checked against each other.
+    void setElementGroups(const std::vector<std::shared_ptr<OpenLxApp::Element>>& aGroupA,
+                          const std::vector<std::shared_ptr<OpenLxApp::Element>>& aGroupB);
+    /// Checks all elements of the document against each other
+    void clearElementGroups();
+    //@}
+
+    /** @name Exclusion rules */
+    //@{
+    /// Elements of this type are not checked at all
+    void excludeType(LxIfc4::LxIfc4EntityEnum aType);
+    /// Pairs of elements of these two types are not checked (e.g. IFCWALL and IFCSLAB)
+    void excludeTypePair(LxIfc4::LxIfc4EntityEnum aType1, LxIfc4::LxIfc4EntityEnum aType2);
+    /// Elements on this layer are not checked at all
+    void excludeLayer(int aLayer);
+    /// Ignores clashes of the given types, e.g. CLASH_ABUTS
+    void ignoreClashType(Topo::BodyClashType aType);
+    void clearExclusions();
+    //@}
+
+    /** @name Running */
+    //@{
+    /// Checks all elements. Returns the number of clashes. 'aCallback' is called in the main thread with the progress in percent.
+    size_t run(const Topo::MainThreadCallback* aCallback = nullptr);
+    /// Observes the document and collects the changed elements for update()
+    void setIncremental(bool on);
+    bool isIncremental() const;
+    /// Adds the objects of 'aChanges' to the elements to re-check (done automatically with setIncremental(true))
+    void addChanges(const OpenLxApp::DocumentChanges& aChanges);
+    /// Number of elements waiting to be re-checked
+    size_t getPendingCount() const;
+    /// Re-checks the changed elements only. Does a full run() if run() was never called. Returns the number of clashes.
+    size_t update(const Topo::MainThreadCallback* aCallback = nullptr);
+    //@}
+
+    /** @name Results */
+    //@{
+    std::vector<OpenLxApp::ClashResult> getClashes() const;
+    /// Clashes in which 'aElem' takes part
+    std::vector<OpenLxApp::ClashResult> getClashes(std::shared_ptr<OpenLxApp::Element> aElem) const;
+    /// Number of pairs passed to the narrow phase by the last run() or update()
+    size_t getCandidatePairCount() const;
+    //@}
+
+private:
+    std::shared_ptr<OpenLxApp::ClashDetectorP> mPimpl;
+};
+
+}  // namespace OpenLxApp
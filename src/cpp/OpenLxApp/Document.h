@@ -52,6 +52,7 @@ namespace OpenLxApp
 {
 class Application;
 class DocumentObserver;
+class GeometryInstanceRegistry;
 
 /**
  * @brief Document holding all persistent DocObjects.
@@ -164,6 +165,37 @@ public:
     std::shared_ptr<BuildingStorey> getActiveBuildingStorey();
     //@}
 
+    /** @name Spatial index
+     *  R-tree of the world bounding boxes of the elements. It is built when enabled and then
+     *  kept up to date from the new, updated and deleted objects of every recompute.
+     *  The queries also work without the index, but then scan all elements.
+     */
+    //@{
+    void setSpatialIndexEnabled(bool on);
+    bool isSpatialIndexEnabled() const;
+    /// Returns all elements whose world bounding box intersects 'aBox'
+    std::vector<std::shared_ptr<Element>> queryElementsInBox(const Geom::Bnd_Box& aBox);
+    /// Returns the 'k' elements whose world bounding boxes are nearest to 'aPnt', sorted by increasing distance
+    std::vector<std::shared_ptr<Element>> queryNearestElements(const Geom::Pnt& aPnt, int k);
+    //@}
+
+    /** @name Geometry instancing */
+    //@{
+    /// Registry of the Geometry objects shared by several elements of this document. Created on first use.
+    std::shared_ptr<GeometryInstanceRegistry> getGeometryInstanceRegistry();
+    //@}
+
+    /** @name Shape cache */
+    //@{
+    /// With the shape cache enabled saveAs() also writes the shapes to a Topo::ShapeCacheFile next to the file
+    /// (getShapeCacheFileName()). When the file is opened again and the cache matches its content hash, the shapes
+    /// are read from the memory-mapped cache when they are first accessed instead of being parsed on opening.
+    void setShapeCacheEnabled(bool on);
+    bool isShapeCacheEnabled() const;
+    /// File name of the shape cache of the document file, empty if the document was never saved
+    Base::String getShapeCacheFileName() const;
+    //@}
+
     /** @name Styles */
     //@{
     Draw::PointStyle getActivePointStyle() const;
@@ -5,6 +5,7 @@
 #include <OpenLxApp/MaterialSelect.h>
 #include <OpenLxApp/Product.h>
 #include <OpenLxApp/Property.h>
+#include <Topo/MassProperties.h>
 #include <Topo/ShapeAttributes.h>
 
 #include <memory>
@@ -99,6 +100,27 @@ public:
     void setBoundingBoxEnabled(bool enabled);
     CdwkAttributeData getCdwkAttributeData() const;
     void setCdwkAttributeData(const CdwkAttributeData& aData);
+    /// Topo::ShapeTool::getMassProperties() of the world shapes (Product::getShape()) of 'aElements'
+#ifndef SWIG
+    static std::vector<Topo::MassProperties> getMassProperties(const std::vector<std::shared_ptr<Element>>& aElements, bool aWithAreaFromTop = false);
+#endif
+    /// Topo::ShapeTool::getMassPropertiesTable() of the world shapes of 'aElements'
+    static std::vector<double> getMassPropertiesTable(const std::vector<std::shared_ptr<Element>>& aElements, bool aWithAreaFromTop = false);
+    //@}
+
+    /** @name Levels of detail
+     *  Decimated meshes of the element (Topo::MeshTool::makeLODs()) for viewers and exporters.
+     *  Level 0 is the full resolution shape. The levels are saved with the element and
+     *  dropped when its geometry changes.
+     */
+    //@{
+    /// Creates one level for each ratio of 'aRatios' from the triangulation of the element. Returns the number of levels created.
+    int createMeshLODs(const std::vector<double>& aRatios, double aCreaseAngle = 0.5);
+    /// Number of levels including level 0
+    int getMeshLODCount() const;
+    /// Mesh of level 'aLevel' (1..getMeshLODCount()-1), nullptr if there is no such level
+    pConstMesh getMeshLOD(int aLevel) const;
+    void clearMeshLODs();
     //@}
 
     /** @desc Interface to allow "switching" between Axis and SolidModel Representations */
@@ -0,0 +1,87 @@
+#pragma once
+
+#include <Topo/Types.h>
+
+#include <memory>
+#include <string>
+#include <vector>
+
+namespace OpenLxApp
+{
+class Document;
+class Geometry;
+class GeometryInstanceRegistryP;
+
+/**
+ * @brief Hash map of shared Geometry objects of a Document (geometry instancing).
+ *
+ * Elements and SubElements with identical geometry but different placement can share one
+ * Geometry object: the geometry is looked up by a key and, if it exists, set on the new
+ * (Sub)Element together with its own transformation instead of building a new Geometry.
+ *
+ * A key is either
+ * - a parameter key (makeKey()): a type name and a list of numbers which are quantized
+ *   with the tolerance of the registry, so that values within the tolerance usually give
+ *   the same key. Values lying on both sides of a quantization step get different keys,
+ *   which only costs a duplicate geometry.
+ * - a shape key (makeShapeKey()): a fingerprint (MD5) of the shape geometry.
+ *
+ * Lookups are O(1). The registry keeps the Geometry objects alive and removes entries whose
+ * Geometry was deleted from the document. Exporters ask isShared() / getGeometryUseCount()
+ * to write a shared geometry only once (e.g. as mapped item in IFC).
+ *
+ * @code
+ * reg = doc.getGeometryInstanceRegistry()
+ * key = reg.makeKey("square", [length, width, height])
+ * geom = reg.find(key)
+ * if geom is None:
+ *     geom = makeBeamGeometry(...)
+ *     reg.add(key, geom)
+ * subElem.setGeometry(geom)
+ * subElem.setTransform(trsf)
+ * @endcode
+ *
+ * @ingroup OPENLX_FRAMEWORK
+ * @since    28.0
+ */
+class LX_OPENLXAPP_EXPORT GeometryInstanceRegistry
+{
+public:
+    explicit GeometryInstanceRegistry(std::shared_ptr<OpenLxApp::Document> aDoc, double aTolerance = 1E-03);
+    ~GeometryInstanceRegistry();
+
+    GeometryInstanceRegistry(const GeometryInstanceRegistry&) = delete;
+    GeometryInstanceRegistry& operator=(const GeometryInstanceRegistry&) = delete;
+
+    /// Quantization step of makeKey()
+    void setTolerance(double aTolerance);
+    double getTolerance() const;
+
+    /// Key from a type name and parameters quantized with getTolerance()
+    std::string makeKey(const std::string& aTypeName, const std::vector<double>& aParams) const;
+    /// Key from the fingerprint of the shape geometry. Returns an empty string for an empty shape.
+    std::string makeShapeKey(pConstShape aShape) const;
+
+    /// Returns the geometry registered for 'aKey' or nullptr
+    std::shared_ptr<OpenLxApp::Geometry> find(const std::string& aKey) const;
+    /// Registers 'aGeom' for 'aKey'. An existing entry is replaced.
+    void add(const std::string& aKey, std::shared_ptr<OpenLxApp::Geometry> aGeom);
+    void remove(const std::string& aKey);
+    void clear();
+    size_t size() const;
+
+    /// Number of (Sub)Elements using 'aGeom'
+    int getGeometryUseCount(std::shared_ptr<OpenLxApp::Geometry> aGeom) const;
+    /// Returns true if 'aGeom' is used by more than one (Sub)Element
+    bool isShared(std::shared_ptr<OpenLxApp::Geometry> aGeom) const;
+
+    /// Number of find() calls that returned a geometry
+    size_t getHitCount() const;
+    /// Number of find() calls that returned nullptr
+    size_t getMissCount() const;
+
+private:
+    std::shared_ptr<OpenLxApp::GeometryInstanceRegistryP> mPimpl;
+};
+
+}  // namespace OpenLxApp
@@ -40,6 +40,9 @@ public:
 
 
     virtual int exportFile(const Base::String& filename) override;
+    /// Same as exportFile(), but writes the meshes of level 'aLevelOfDetail' (see Element::createMeshLODs()).
+    /// Elements with fewer levels use their coarsest one. Level 0 is the full resolution shape.
+    int exportFile(const Base::String& filename, int aLevelOfDetail);
 
 
 private:
@@ -1,6 +1,7 @@
 #pragma once
 
 #include <Geom/Pnt2d.h>
+#include <Geom/PointListSet.h>
 #include <OpenLxApp/ArbitraryClosedProfileDef.h>
 #include <OpenLxApp/ArbitraryOpenProfileDef.h>
 #include <OpenLxApp/ArbitraryProfileDefWithVoids.h>
@@ -23,6 +24,10 @@ LX_OPENLXAPP_EXPORT std::shared_ptr<ArbitraryProfileDefWithVoids> createArbitrar
     std::shared_ptr<Document> aDoc,
     const std::vector<Geom::Pnt2d> aOuterLoop,
     const std::vector<std::vector<Geom::Pnt2d>> aInnerLoops);
+LX_OPENLXAPP_EXPORT std::shared_ptr<ArbitraryProfileDefWithVoids> createArbitraryProfileDefWithVoids(
+    std::shared_ptr<Document> aDoc,
+    const std::vector<Geom::Pnt2d> aOuterLoop,
+    const Geom::PointListSet2d& aInnerLoops);
 
 
 }  // namespace OpenLxApp
\ No newline at end of file
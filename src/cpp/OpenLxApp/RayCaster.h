@@ -0,0 +1,114 @@
+#pragma once
+
+#include <Geom/Pnt.h>
+#include <Geom/Vec.h>
+#include <Topo/ShapeTessellationQuality.h>
+
+#include <cstdint>
+#include <memory>
+#include <vector>
+
+namespace OpenLxApp
+{
+class Document;
+class Element;
+class RayCasterP;
+
+/**
+ * @brief Traces many rays against the triangulations of a set of elements.
+ *
+ * The triangles of the elements (in world coordinates) are put into a bounding volume
+ * hierarchy which is built once and kept: after a recompute only the modified elements
+ * are re-triangulated and the hierarchy is refitted (with setAutoUpdate(true), which is
+ * the default, this happens on the next cast; otherwise call update()).
+ *
+ * The rays are given by vectors of origins and directions and traced in parallel.
+ * The results are vectors as well, one entry per ray:
+ * - element index (see getElement(), -1 if the ray hits nothing),
+ * - face index of the hit face in the element's shape (Topo::RayHit::getHitItemIdx()),
+ * - ray parameter of the hit (distance if the direction is a unit vector, NaN if no hit),
+ * - normal of the hit triangle (NaN if no hit).
+ * In C++ the rays can also be passed as x,y,z triplets in raw buffers.
+ *
+ * @ingroup OPENLX_FRAMEWORK
+ * @since    28.0
+ */
+class LX_OPENLXAPP_EXPORT RayCaster
+{
+public:
+    /// Uses all elements of 'aDoc' which have a geometry
+    explicit RayCaster(std::shared_ptr<OpenLxApp::Document> aDoc);
+    ~RayCaster();
+
+    RayCaster(const RayCaster&) = delete;
+    RayCaster& operator=(const RayCaster&) = delete;
+
+    /** @name Elements */
+    //@{
+    /// Uses 'aElements' only
+    void setElements(const std::vector<std::shared_ptr<OpenLxApp::Element>>& aElements);
+    /// Uses all elements of the document which have a geometry (default)
+    void setAllElements();
+    size_t getElementCount() const;
+    /// The element with index 'aIndex' (as returned by castRays())
+    std::shared_ptr<OpenLxApp::Element> getElement(int64_t aIndex) const;
+    /// Index of 'aElem', -1 if it is not in the set
+    int64_t getElementIndex(std::shared_ptr<OpenLxApp::Element> aElem) const;
+    /// Quality of the triangulation. Default is Topo::ShapeTessellationQuality().
+    void setTessellationQuality(const Topo::ShapeTessellationQuality& aQuality);
+    //@}
+
+    /** @name Updating */
+    //@{
+    /// Follows the recomputes of the document (default is true)
+    void setAutoUpdate(bool on);
+    bool isAutoUpdate() const;
+    /// Re-triangulates the new and modified elements and refits the hierarchy
+    void update();
+    /// Number of triangles in the hierarchy
+    size_t getTriangleCount() const;
+    //@}
+
+    /** @name Tracing */
+    //@{
+    /**
+     * Finds the nearest hit of each ray within 'maxParam' (< 0 means no limit) and returns
+     * the element indices. 'origins' and 'directions' have the same size.
+     */
+    std::vector<int> castRays(const std::vector<Geom::Pnt>& origins, const std::vector<Geom::Vec>& directions, double maxParam) const;
+    /// Same as above, also returns the face indices, ray parameters and normals. Returns the number of rays that hit something.
+    int castRays(const std::vector<Geom::Pnt>& origins,
+                 const std::vector<Geom::Vec>& directions,
+                 double maxParam,
+                 std::vector<int>& elementIndices,
+                 std::vector<int>& faceIndices,
+                 std::vector<double>& params,
+                 std::vector<Geom::Vec>& normals) const;
+    /**
+     * Line of sight: returns 1 for every ray which hits anything within 'maxParam', 0 otherwise.
+     * Stops at the first hit found, so it is faster than castRays().
+     */
+    std::vector<int> castRaysAnyHit(const std::vector<Geom::Pnt>& origins, const std::vector<Geom::Vec>& directions, double maxParam) const;
+    /// Rays from 'origins' to 'targets' (segment tests), returns 1 for every blocked segment, 0 otherwise
+    std::vector<int> testSegments(const std::vector<Geom::Pnt>& origins, const std::vector<Geom::Pnt>& targets) const;
+
+#ifndef SWIG
+    /// Same as above for 'count' rays given as x,y,z triplets. Pass nullptr for outputs that are not needed.
+    int64_t castRays(const double* origins,
+                     const double* directions,
+                     int64_t count,
+                     double maxParam,
+                     int64_t* elementIndices,
+                     int64_t* faceIndices = nullptr,
+                     double* params = nullptr,
+                     double* normals = nullptr) const;
+    int64_t castRaysAnyHit(const double* origins, const double* directions, int64_t count, double maxParam, unsigned char* hitMask) const;
+    int64_t testSegments(const double* origins, const double* targets, int64_t count, unsigned char* hitMask) const;
+#endif
+    //@}
+
+private:
+    std::shared_ptr<OpenLxApp::RayCasterP> mPimpl;
+};
+
+}  // namespace OpenLxApp
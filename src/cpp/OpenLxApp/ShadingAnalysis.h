@@ -0,0 +1,107 @@
+#pragma once
+
+#include <Geom/Vec.h>
+
+#include <cstdint>
+#include <memory>
+#include <vector>
+
+namespace Topo
+{
+class MainThreadCallback;
+}
+
+namespace OpenLxApp
+{
+class Document;
+class Element;
+class ShadingAnalysisP;
+
+/**
+ * @brief Sun/shadow study for many sun directions at once.
+ *
+ * The faces of the receiver elements are sampled with points (getSampleSpacing()) and the
+ * occluder elements are put into one OpenLxApp::RayCaster, which is shared by all directions.
+ * For each sun direction every sample point of every face turned towards the sun is tested
+ * for a free line of sight; the directions are evaluated in parallel. This replaces calling
+ * ShapeTool::projectShadow() / ShapeTool::getVisibleAreaFrom() once per face and direction.
+ *
+ * The results are stored row by row: one row per direction, one column per receiver face
+ * (see getFaces()), i.e. the shaded area of face j for direction i is at i * getFaceCount() + j.
+ * Faces turned away from the sun are fully shaded (self shadowing).
+ *
+ * @code
+ * study = lx.ShadingAnalysis(doc)
+ * study.setReceivers(walls)
+ * shaded = Base.vector_double()
+ * lit = Base.vector_double()
+ * study.run(dirs, shaded, lit)
+ * n = study.getFaceCount()
+ * row = shaded[i * n:(i + 1) * n]
+ * @endcode
+ *
+ * @ingroup OPENLX_FRAMEWORK
+ * @since    28.0
+ */
+class LX_OPENLXAPP_EXPORT ShadingAnalysis
+{
+public:
+    explicit ShadingAnalysis(std::shared_ptr<OpenLxApp::Document> aDoc);
+    ~ShadingAnalysis();
+
+    ShadingAnalysis(const ShadingAnalysis&) = delete;
+    ShadingAnalysis& operator=(const ShadingAnalysis&) = delete;
+
+    /** @name Setup */
+    //@{
+    /// Elements whose faces are evaluated
+    void setReceivers(const std::vector<std::shared_ptr<OpenLxApp::Element>>& aElements);
+    /// Elements which cast shadows. Default is all elements of the document (including the receivers).
+    void setOccluders(const std::vector<std::shared_ptr<OpenLxApp::Element>>& aElements);
+    /// Distance between the sample points on the faces in model units. Default is 0.25.
+    void setSampleSpacing(double aSpacing);
+    double getSampleSpacing() const;
+    //@}
+
+    /** @name Faces */
+    //@{
+    /// Number of receiver faces (= columns of the results)
+    int64_t getFaceCount() const;
+    /// For every column: index of the receiver element (see getReceiver()) and index of the face in its shape
+    void getFaces(std::vector<int>& elementIndices, std::vector<int>& faceIndices) const;
+    std::shared_ptr<OpenLxApp::Element> getReceiver(int64_t aIndex) const;
+    /// Area of every receiver face
+    std::vector<double> getFaceAreas() const;
+#ifndef SWIG
+    /// Same as above, the arrays must hold getFaceCount() values
+    void getFaces(int64_t* elementIndices, int64_t* faceIndices) const;
+    void getFaceAreas(double* areas) const;
+#endif
+    //@}
+
+    /**
+     * Evaluates the 'sunDirections' (pointing from the model towards the sun).
+     * 'shadedAreas' and 'litAreas' get sunDirections.size() * getFaceCount() values.
+     * Directions with z <= 0 (sun below the horizon) give fully shaded faces.
+     * 'aCallback' is called in the main thread with the progress in percent. Returns false if cancelled.
+     */
+    bool run(const std::vector<Geom::Vec>& sunDirections,
+             std::vector<double>& shadedAreas,
+             std::vector<double>& litAreas,
+             const Topo::MainThreadCallback* aCallback = nullptr);
+#ifndef SWIG
+    /// Same as above for 'count' directions given as x,y,z triplets. The arrays are allocated by the caller, 'litAreas' is optional.
+    bool run(const double* sunDirections,
+             int64_t count,
+             double* shadedAreas,
+             double* litAreas = nullptr,
+             const Topo::MainThreadCallback* aCallback = nullptr);
+#endif
+    /// Stops a running run() after the directions currently evaluated
+    void cancel();
+
+private:
+    std::shared_ptr<OpenLxApp::ShadingAnalysisP> mPimpl;
+};
+
+}  // namespace OpenLxApp
@@ -20,6 +20,9 @@ public:
     void setSingleHtmlFile(bool aFlag);
     bool getSingleHtmlFile() const;
     virtual int exportFile(const Base::String& aFileOrDirName) override;
+    /// Same as exportFile(), but writes the meshes of level 'aLevelOfDetail' (see Element::createMeshLODs()).
+    /// Elements with fewer levels use their coarsest one. Level 0 is the full resolution shape.
+    int exportFile(const Base::String& aFileOrDirName, int aLevelOfDetail);
 
 private:
     bool _singleHtmlFile = false;
@@ -0,0 +1,19 @@
+#pragma once
+
+namespace Topo
+{
+enum class BooleanOperation
+{
+    CUT,
+    FUSE,
+    COMMON
+};
+
+enum class BooleanToolStatus  // per tool result of ShapeTool::booleanMultiple()
+{
+    APPLIED,             // the tool took part in the operation
+    SKIPPED_NO_OVERLAP,  // the bounding box of the tool does not intersect the base, nothing to do
+    FAILED,              // the operation failed for this tool, the result does not contain it
+    INVALID_TOOL         // nullptr, empty or not a solid/shell
+};
+}  // namespace Topo
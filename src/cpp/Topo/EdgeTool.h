@@ -20,6 +20,7 @@
 #pragma once
 
 
+#include <Geom/PointListSet.h>
 #include <Topo/ToolResults.h>
 namespace Base { struct Double; }
 namespace Core { class DocObject; }
@@ -109,6 +110,55 @@ public:
 
     //@}
 
+    /** @name Array interfaces
+     *  Evaluate or discretize edges at many parameters in one call.
+     */
+    //@{
+    /// Returns the points at all 'params', empty if the edge has no curve
+    static std::vector<Geom::Pnt> evaluate(pConstEdge edge, const std::vector<double>& params);
+    /// Evaluates the point and the derivatives up to order 'derivatives' (0..3) at all 'params' in one loop.
+    /// The outputs get one entry per parameter, the derivatives above 'derivatives' are left empty.
+    /// Returns false if the edge has no curve.
+    static bool evaluate(pConstEdge edge,
+                         const std::vector<double>& params,
+                         int derivatives,
+                         std::vector<Geom::Pnt>& points,
+                         std::vector<Geom::Vec>& d1,
+                         std::vector<Geom::Vec>& d2,
+                         std::vector<Geom::Vec>& d3);
+#ifndef SWIG
+    /// Same as above for 'count' parameters, points and derivatives are written as x,y,z triplets into buffers
+    /// allocated by the caller. Pass nullptr for derivatives that are not needed.
+    static bool evaluate(pConstEdge edge,
+                         const double* params,
+                         int64_t count,
+                         int derivatives,
+                         double* points,
+                         double* d1 = nullptr,
+                         double* d2 = nullptr,
+                         double* d3 = nullptr);
+#endif
+    /**
+     * Adaptive discretization: the edge is subdivided until the chord height is below 'chordHeight', the angle between
+     * the tangents at the ends of a segment is below 'angularDeviation' (radians) and no segment is longer than
+     * 'maxSegmentLength' (<= 0: no limit). A straight edge gives its two end points if 'maxSegmentLength' <= 0, otherwise
+     * it is split into the smallest number of equal segments not longer than 'maxSegmentLength'. 'params' (optional) gets
+     * the curve parameter of every point. Returns false if the edge has no curve.
+     */
+    static bool discretize(pConstEdge edge,
+                           double chordHeight,
+                           double angularDeviation,
+                           double maxSegmentLength,
+                           std::vector<Geom::Pnt>& points,
+                           std::vector<double>* params = nullptr);
+    /// discretize() for many edges in parallel, polyline i of 'polylines' belongs to edge i (empty if the edge has no curve)
+    static bool discretize(const std::vector<pConstEdge>& edges,
+                           double chordHeight,
+                           double angularDeviation,
+                           double maxSegmentLength,
+                           Geom::PointListSet& polylines);
+    //@}
+
 #ifndef SWIG  // INTERFACES BELOW ARE -NOT- PART OF THE LEXOCAD API
     /// @cond INTERNAL
     /// Sets the default EdgeTool. For internal use only.
@@ -132,6 +182,13 @@ protected:
     virtual bool _d1(pConstEdge edge, double u, Geom::Pnt& p, Geom::Vec& v1);
     virtual bool _d2(pConstEdge edge, double u, Geom::Pnt& p, Geom::Vec& v1, Geom::Vec& v2);
     virtual bool _d3(pConstEdge edge, double u, Geom::Pnt& p, Geom::Vec& v1, Geom::Vec& v2, Geom::Vec& v3);
+    virtual bool _evaluate(pConstEdge edge, const double* params, int64_t count, int derivatives, double* points, double* d1, double* d2, double* d3);
+    virtual bool _discretize(pConstEdge edge,
+                             double chordHeight,
+                             double angularDeviation,
+                             double maxSegmentLength,
+                             std::vector<Geom::Pnt>& points,
+                             std::vector<double>* params);
     virtual bool _splitEdge(pConstEdge edge, double u, pEdge& edge1, pEdge& edge2);
     virtual bool _getGeomCurveType(pConstEdge edge, Geom::CurveType& type);
     virtual double _getLength(pConstEdge edge);
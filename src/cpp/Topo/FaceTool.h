@@ -100,7 +100,7 @@ public:
     static pFace makeFace(pWire outerWire, const std::vector<pWire>& innerWires, double precision = Geom::Precision::linear_Resolution());
     /// Makes a polygonal face from a vector of points
     static pFace makePolygon(const std::vector<Geom::Pnt>& points);
-    /// Checks if p is a valid point on face within the given tolerance.
+    /// Checks if p is a valid point on face within the given tolerance. Use Topo::FacePointClassifier to check many points against the same planar face.
     static bool isValidPointForFace(const Geom::Pnt& p, pConstFace face, double precision = Geom::Precision::linear_Resolution());
     /// Returns a copy of 'face' transformed by 'transform'
     static pFace transformed(pConstFace face, const Geom::Trsf& transform);
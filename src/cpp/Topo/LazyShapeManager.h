@@ -0,0 +1,75 @@
+#pragma once
+
+#include <Topo/Types.h>
+
+#include <cstdint>
+
+namespace Topo
+{
+/**
+ * @brief Keeps the BREPs of Topo::LazyFacetedBrepShape within a memory budget.
+ *
+ * Every materialized lazy shape is kept in an LRU list. A shape is moved to the front when
+ * it is materialized or used by a kernel operation. When the memory used by the BREPs exceeds
+ * getMemoryBudget() the least recently used shapes are released back to their faceted data
+ * (they are materialized again on their next use). Shapes locked with a Pin are never released.
+ *
+ * Viewers and exporters read the faceted data (LazyFacetedBrepShape::getFacetedShape()) and
+ * do not materialize, so a large IFC import only builds the BREPs of the shapes which are
+ * actually modelled with. All functions are thread safe.
+ *
+ * @ingroup TOPO_SHAPETOOLS
+ * @since    28.0
+ */
+class LX_TOPO_EXPORT LazyShapeManager
+{
+public:
+    /// Maximal memory used by materialized BREPs in bytes. 0 = no limit (default).
+    static void setMemoryBudget(uint64_t bytes);
+    static uint64_t getMemoryBudget();
+
+    /// Materializes 'shape' and marks it as most recently used. Returns false on failure.
+    static bool materialize(pConstLazyFacetedBrepShape shape);
+    /// Marks 'shape' as most recently used (without materializing it)
+    static void touch(pConstLazyFacetedBrepShape shape);
+    /// Same as materialize() and touch() for any shape (e.g. Product::getShape()). Returns false if 'shape' is not a LazyFacetedBrepShape.
+    static bool materializeShape(pConstShape shape);
+    static void touchShape(pConstShape shape);
+    /// Releases all BREPs which are not pinned
+    static void releaseAll();
+    /// Releases least recently used BREPs until the budget is met. Called automatically by materialize().
+    static void trim();
+
+    /** @name Statistics */
+    //@{
+    /// Number of materialized shapes
+    static uint64_t getMaterializedCount();
+    /// Bytes used by the materialized BREPs
+    static uint64_t getMemoryUsage();
+    /// Number of BREPs built since the last resetStatistics()
+    static uint64_t getMaterializationCount();
+    /// Number of BREPs released because of the budget since the last resetStatistics()
+    static uint64_t getEvictionCount();
+    static void resetStatistics();
+    //@}
+
+#ifndef SWIG
+    /// Keeps a shape materialized during its lifetime (e.g. during a boolean operation)
+    class LX_TOPO_EXPORT Pin
+    {
+    public:
+        explicit Pin(pConstLazyFacetedBrepShape shape);
+        ~Pin();
+        Pin(const Pin&) = delete;
+        Pin& operator=(const Pin&) = delete;
+
+    private:
+        pConstLazyFacetedBrepShape _shape;
+    };
+#endif
+
+private:
+    LazyShapeManager() = delete;
+};
+
+}  // namespace Topo
@@ -0,0 +1,40 @@
+#pragma once
+
+#include <Geom/Pnt.h>
+
+
+namespace Topo
+{
+/**
+ * @brief Mass properties of one shape, see ShapeTool::getMassProperties().
+ *
+ * Python gets the same values as one flat table (ShapeTool::getMassPropertiesTable()):
+ * TABLE_COLUMNS values per shape in the order of the members, Valid as 0 or 1 and the
+ * Centroid as x, y, z.
+ *
+ * @since    28.0
+ */
+struct MassProperties
+{
+    MassProperties() = default;
+
+    /// Number of values per shape in ShapeTool::getMassPropertiesTable()
+    static const int TABLE_COLUMNS = 10;
+
+    /// false if the shape is nullptr or the computation failed
+    bool Valid = false;
+    /// ShapeTool::getVolume()
+    double Volume = 0.;
+    /// ShapeTool::getSurfaceArea()
+    double SurfaceArea = 0.;
+    /// ShapeTool::getCentroid()
+    Geom::Pnt Centroid;
+    /// ShapeTool::getVerticalAndHorizontalFaceAreas()
+    double VerticalFaceArea = 0.;
+    double LargestVerticalFaceArea = 0.;
+    double HorizontalFaceArea = 0.;
+    /// ShapeTool::getAreaFromTop(), only computed on request (0 otherwise)
+    double AreaFromTop = 0.;
+};
+
+}  // namespace Topo
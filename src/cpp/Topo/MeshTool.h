@@ -2,6 +2,7 @@
 
 #include <Draw/OglMaterial.h>
 #include <Geom/Pln.h>
+#include <Geom/PointListSet.h>
 #include <Topo/Types.h>
 
 
@@ -39,6 +40,42 @@ struct LX_TOPO_EXPORT LineItem
     Draw::OglMaterial material;
 };
 
+/**
+ * @brief Options of MeshTool::decimate().
+ *
+ * Decimation stops at the first limit reached: the count target selected by 'target' or
+ * 'maxError' (the square root of the quadric error, i.e. roughly the distance of the simplified
+ * surface from the original one in model units). With Target::None and no 'maxError' the mesh is
+ * decimated until no further collapse is allowed.
+ *
+ * @ingroup TOPO_SHAPETOOLS
+ * @since    28.0
+ */
+struct LX_TOPO_EXPORT MeshDecimationOptions
+{
+    enum class Target
+    {
+        TriangleCount = 0,  // stop at 'targetTriangleCount'
+        Ratio = 1,          // stop at 'targetRatio' of the original triangle count
+        None = 2            // no count target, only 'maxError' limits the decimation
+    };
+
+    /// Count target of the decimation
+    Target target = Target::Ratio;
+    /// Number of triangles to reach (used if 'target' is Target::TriangleCount)
+    int targetTriangleCount = 0;
+    /// Fraction of the original triangle count to reach (used if 'target' is Target::Ratio)
+    double targetRatio = 0.5;
+    /// Maximal error. < 0 = no limit.
+    double maxError = -1.;
+    /// Edges between triangles with a larger angle (see MeshTool::computeCreaseEdges()) are kept. < 0 = no crease edges.
+    double creaseAngle = 0.5;
+    /// Keeps the boundary edges (edges shared by only one triangle) of open meshes
+    bool preserveBoundary = true;
+    /// Rejects collapses which flip the normal of a triangle
+    bool preventFlips = true;
+};
+
 /**
  * @brief Tools for creating, manipulating and querying Meshes.
  *
@@ -81,6 +118,16 @@ public:
     static pShape convertMesh2Brep_by_Face_Stiching(pConstMesh mesh, std::vector<std::vector<Geom::Pnt>>& defectPolygons);
     /// Converts a mesh to an open or closed shell
     static pShape convertMesh2Shell(pConstMesh mesh, std::vector<std::vector<Geom::Pnt>>& defectPolygons);
+    /** @name Defect polygons as Geom::PointListSet
+     *  Same as above, but the defect polygons are returned in one flat Geom::PointListSet
+     *  instead of a vector of vectors.
+     */
+    //@{
+    static pShape convertMesh2Shape(pConstMesh mesh, Geom::PointListSet& defectPolygons);
+    static pShape convertMesh2Polyhedral(pConstMesh mesh, Geom::PointListSet& defectPolygons);
+    static pShape convertMesh2Brep_by_Face_Stiching(pConstMesh mesh, Geom::PointListSet& defectPolygons);
+    static pShape convertMesh2Shell(pConstMesh mesh, Geom::PointListSet& defectPolygons);
+    //@}
     /// Makes a mesh from BrepData
     static pMesh makeMeshFromBrepData(pConstBrepData data);
     /// Makes a mesh from Nodes and Texture-Coordinates
@@ -112,7 +159,24 @@ public:
 
     static bool getCreaseAngle(pConstMesh mesh, float& angle);
 
-    
+    /** @name Decimation
+     *  Quadric error decimation (edge collapses). Crease edges (computeCreaseEdges()) and
+     *  the boundary edges are kept, so the silhouette and the sharp features of the mesh
+     *  stay intact. Texture coordinates and surface styles are carried over to the
+     *  remaining vertices and triangles.
+     */
+    //@{
+    /// Returns a simplified copy of 'mesh' or nullptr if the mesh cannot be decimated. 'reachedError' (optional) gets the largest error of the collapses.
+    static pMesh decimate(const pConstMesh& mesh, const Topo::MeshDecimationOptions& options, double* reachedError = nullptr);
+    /// Chain of levels of detail: one mesh for each ratio of 'ratios' (descending, e.g. 0.5, 0.25, 0.1).
+    /// Each level is decimated from the previous one. Levels which could not be reduced further are left out.
+    /// Every returned shape is a MeshShape (ShapeTool::isMesh()). Returns an empty vector if 'mesh' cannot be decimated.
+    static std::vector<pShape> makeLODs(const pConstMesh& mesh, const std::vector<double>& ratios, double creaseAngle);
+#ifndef SWIG
+    static bool makeLODs(const pConstMesh& mesh, const std::vector<double>& ratios, double creaseAngle, std::vector<pMesh>& lods);
+#endif
+    //@}
+
 
     ///////////////////////////////////////////////////////////
     //                                                       //
@@ -229,6 +293,8 @@ private:
                           std::vector<Topo::LineItem>* lineItems = 0);
 
     virtual bool _getCreaseAngle(pConstMesh mesh, float& angle);
+    virtual pMesh _decimate(const pConstMesh& mesh, const Topo::MeshDecimationOptions& options, double* reachedError);
+    virtual bool _makeLODs(const pConstMesh& mesh, const std::vector<double>& ratios, double creaseAngle, std::vector<pMesh>& lods);
 
     virtual pMesh _makePlateFast(const std::vector<Geom::Pnt>& points,
                                  const std::vector<int>& model,
@@ -497,6 +497,14 @@ protected:
 
 
 
+/**
+ * @brief Shape which keeps its geometry as compact faceted data (Topo::FacetedShape) and builds
+ * the faceted BREP only when a kernel operation needs it.
+ *
+ * Viewers and exporters are served from the faceted data. The BREP is built by materialize(),
+ * which the kernel tools call before they work on the shape, and is owned by the
+ * Topo::LazyShapeManager, which releases it again when its memory budget is exceeded.
+ */
 class LX_TOPO_EXPORT LazyFacetedBrepShape : public Topo::Shape
 {
     TYPESYSTEM_HEADER();
@@ -505,6 +513,24 @@ public:
     LazyFacetedBrepShape() = default;
     LazyFacetedBrepShape(pConstShape rhs) {}
     virtual ~LazyFacetedBrepShape() = default;
+
+    /** @name Materialization
+     *  @since    28.0
+     */
+    //@{
+    /// Returns true if the BREP is currently built
+    bool isMaterialized() const;
+    /// Builds the BREP (if necessary) and registers it with the Topo::LazyShapeManager. Returns false on failure.
+    bool materialize() const;
+    /// Releases the BREP, the shape falls back to its faceted data
+    void release() const;
+    /// The faceted data (used by viewers and exporters without materializing)
+    std::shared_ptr<const Topo::FacetedShape> getFacetedShape() const;
+    /// Bytes used by the faceted data
+    uint64_t getFacetedMemoryUsage() const;
+    /// Bytes used by the BREP, 0 if not materialized
+    uint64_t getMaterializedMemoryUsage() const;
+    //@}
 };
 
 
@@ -0,0 +1,92 @@
+#pragma once
+
+#include <Base/String.h>
+#include <Topo/Types.h>
+
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <vector>
+
+namespace Topo
+{
+class ShapeCacheFileP;
+
+/**
+ * @brief Binary file with many shapes which are read on demand through a memory-mapped view.
+ *
+ * Layout (little endian, all offsets relative to the start of the file):
+ * - header: magic "LXSC", format version (getFormatVersion()), number of entries, source hash
+ *   (see write()) and the offset of the entry table,
+ * - the shape data, one block per shape in the format of ShapeTool::write() / getWriteFormat(),
+ * - the entry table: for every shape its key, write format, offset, size and content hash
+ *   (MD5 of the shape data).
+ *
+ * open() maps the file and reads the header and the entry table only. A shape is deserialized
+ * (ShapeTool::read()) the first time getShape() is called for it and then kept. Opening a large
+ * project therefore costs the table only, not the parsing of every BREP.
+ *
+ * The cache is valid across sessions as long as its source hash matches: the owner (e.g. the
+ * document, from the hash of its LXZ file) passes the expected hash to open(), which fails for
+ * files of another source, of another format version or with a damaged table. The data of a
+ * shape is checked against its content hash before it is deserialized; damaged entries
+ * return nullptr and the owner falls back to its regular stream.
+ *
+ * @ingroup TOPO_SHAPETOOLS
+ * @since    28.0
+ */
+class LX_TOPO_EXPORT ShapeCacheFile
+{
+public:
+    ShapeCacheFile();
+    ~ShapeCacheFile();
+
+    ShapeCacheFile(const ShapeCacheFile&) = delete;
+    ShapeCacheFile& operator=(const ShapeCacheFile&) = delete;
+
+    /// Current version of the file format. Files of other versions are not opened.
+    static uint32_t getFormatVersion();
+    /// Content hash (MD5 of the data written by ShapeTool::write()) of 'shape'. Empty if the shape cannot be written.
+    static std::string computeContentHash(pConstShape shape);
+    /**
+     * Writes 'shapes' with their 'keys' (same size, unique) to 'fileName'. The shapes are serialized in parallel.
+     * 'sourceHash' identifies the data the cache was made from and is checked by open().
+     */
+    static bool write(const Base::String& fileName,
+                      const std::vector<pConstShape>& shapes,
+                      const std::vector<std::string>& keys,
+                      const std::string& sourceHash);
+
+    /** @name Reading */
+    //@{
+    /// Maps 'fileName' and reads its entry table. Fails if the version or 'expectedSourceHash' (if not empty) do not match.
+    bool open(const Base::String& fileName, const std::string& expectedSourceHash = std::string());
+    bool isOpen() const;
+    /// Unmaps the file. Shapes already returned by getShape() stay valid.
+    void close();
+    std::string getSourceHash() const;
+
+    /// Number of shapes in the file
+    size_t size() const;
+    std::string getKey(size_t index) const;
+    /// Index of the shape with 'key', -1 if there is none
+    int64_t findIndex(const std::string& key) const;
+    std::string getContentHash(size_t index) const;
+    /// Size of the serialized shape in bytes
+    uint64_t getDataSize(size_t index) const;
+
+    /// Returns the shape, deserializing it on the first call. Returns nullptr if the entry is damaged. Thread safe.
+    pConstShape getShape(size_t index) const;
+    /// Same as getShape(findIndex(key))
+    pConstShape getShape(const std::string& key) const;
+    /// Returns true if the shape has been deserialized already
+    bool isLoaded(size_t index) const;
+    /// Number of shapes deserialized so far
+    size_t getLoadedCount() const;
+    //@}
+
+private:
+    std::shared_ptr<Topo::ShapeCacheFileP> mPimpl;
+};
+
+}  // namespace Topo
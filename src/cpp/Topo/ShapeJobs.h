@@ -0,0 +1,127 @@
+#pragma once
+
+#include <Base/String.h>
+#include <Geom/Dir.h>
+#include <Geom/Trsf.h>
+#include <Topo/Boolean.h>
+#include <Topo/Types.h>
+
+#include <functional>
+#include <memory>
+#include <vector>
+
+namespace Topo
+{
+class MainThreadCallback;
+class ShapeJobBatchP;
+
+/**
+ * @brief Result of one job of a Topo::ShapeJobBatch.
+ *
+ * @ingroup TOPO_SHAPETOOLS
+ * @since    28.0
+ */
+class LX_TOPO_EXPORT ShapeFuture
+{
+public:
+    ShapeFuture();
+    ~ShapeFuture();
+
+    /// Returns true if the job has finished (successfully or not)
+    bool isReady() const;
+    /// Blocks until the job has finished
+    void wait() const;
+    /// Waits for the job and returns the shape. Returns nullptr if the job failed or was cancelled.
+    pShape get() const;
+    /// Waits for the job and returns true if it produced a shape
+    bool isOkay() const;
+    /// Waits for the job and returns the reason of the failure, empty if the job succeeded
+    Base::String getErrorMessage() const;
+
+private:
+    friend class ShapeJobBatch;
+    friend class ShapeJobBatchP;
+    std::shared_ptr<Topo::ShapeJobBatchP> mPimpl;
+    int64_t _index = -1;
+};
+
+/**
+ * @brief A batch of independent shape-construction jobs run on the kernel thread pool.
+ *
+ * Jobs are collected with the add...() functions, which return the index of the job,
+ * and run on ShapeTool::getThreadPool(), either blocking with run() or in the background
+ * with start(). Every job has a Topo::ShapeFuture.
+ *
+ * The jobs run in the threads of the pool and never call into Python. They only call kernel
+ * functions (SolidTool, FaceTool, ShapeTool booleans) on their inputs, so the input shapes
+ * must not be modified while the batch is running.
+ *
+ * @code
+ * batch = Topo.ShapeJobBatch()
+ * for beam in beams:
+ *     batch.addBox(beam.length, beam.width, beam.height, beam.trsf)
+ * batch.run()
+ * shapes = batch.getResults()
+ * @endcode
+ *
+ * @ingroup TOPO_SHAPETOOLS
+ * @since    28.0
+ */
+class LX_TOPO_EXPORT ShapeJobBatch
+{
+public:
+    ShapeJobBatch();
+    /// Cancels the jobs which have not started yet and waits for the running ones
+    ~ShapeJobBatch();
+
+    ShapeJobBatch(const ShapeJobBatch&) = delete;
+    ShapeJobBatch& operator=(const ShapeJobBatch&) = delete;
+
+    /** @name Jobs
+     *  Each function returns the index of the new job. 'placement' is applied to the result.
+     */
+    //@{
+    /// SolidTool::makeBox()
+    int64_t addBox(double length, double width, double height, const Geom::Trsf& placement = Geom::Trsf());
+    /// SolidTool::makeCylinder()
+    int64_t addCylinder(double radius, double height, const Geom::Trsf& placement = Geom::Trsf());
+    /// FaceTool::extrudedFace()
+    int64_t addExtrudedFace(pConstFace face, const Geom::Dir& extrudedDirection, double depth, const Geom::Trsf& placement = Geom::Trsf());
+    /// ShapeTool::cut(), ShapeTool::fuse() or ShapeTool::common()
+    int64_t addBoolean(Topo::BooleanOperation operation, pConstShape base, pConstShape tool, const Geom::Trsf& placement = Geom::Trsf());
+    /// ShapeTool::makeShape() from BrepData
+    int64_t addBrepData(pConstBrepData data, const Geom::Trsf& placement = Geom::Trsf());
+#ifndef SWIG
+    /// Any function which makes a shape. Must not call into Python.
+    int64_t addJob(std::function<pShape()> job);
+#endif
+    //@}
+
+    /// Number of jobs
+    int64_t size() const;
+    /// Removes all jobs. Must not be called while the batch is running.
+    void clear();
+
+    /// Runs all jobs and returns when they are done. 'callback' is called in the main thread with the progress in percent.
+    void run(const Topo::MainThreadCallback* callback = nullptr);
+    /// Starts all jobs in the background and returns immediately
+    void start();
+    /// Waits for all jobs started with start()
+    void wait();
+    /// Jobs which have not started yet are skipped, their futures return nullptr
+    void cancel();
+    /// Returns true if no job is running or waiting
+    bool isFinished() const;
+    /// Progress in percent of the running batch
+    int getProgress() const;
+
+    /// The future of job 'index'
+    Topo::ShapeFuture getFuture(int64_t index) const;
+    /// Waits for all jobs and returns their shapes in the order they were added (nullptr for failed jobs)
+    std::vector<pShape> getResults() const;
+
+private:
+    std::shared_ptr<Topo::ShapeJobBatchP> mPimpl;
+};
+
+}  // namespace Topo
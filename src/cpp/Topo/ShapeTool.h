@@ -2,11 +2,14 @@
 
 
 #include <Base/Color.h>
+#include <Topo/Boolean.h>
 #include <functional>
 #include <Geom/Bnd_box.h>
+#include <Geom/PointListSet.h>
 #include <Geom/Precision.h>
 #include <Topo/Clash.h>
 #include <Topo/GeometricInformation.h>
+#include <Topo/MassProperties.h>
 #include <Topo/ShapeTessellationQuality.h>
 #include <Topo/ToolOutcome.h>
 #include <Topo/Types.h>
@@ -89,6 +92,20 @@ class ThreadPool;
 class VisibleEdge;
 class RayHit;
 typedef std::vector<RayHit> RayHitVector;
+
+/**
+ * @brief Position of a walk over the faces, wires, edges or vertices of an item.
+ *
+ * Made by ShapeTool::makeFaceCursor() etc. and advanced by ShapeTool::nextFace() etc.
+ * The kernel's ShapeTool derives its topology explorer from it.
+ *
+ * @since    28.0
+ */
+class LX_TOPO_EXPORT TopologyCursor
+{
+public:
+    virtual ~TopologyCursor() = default;
+};
 /**
  * @brief Tools for creating, manipulating and querying Shapes.
  *
@@ -149,6 +166,8 @@ public:
     static pShape makeShape(BODY* aBody);
     /// Makes a shape from BrepData
     static pShape makeLazyFacetedBrepShape(pConstBrepData data, std::vector<PNTS>& defectPolygons);
+    /// Makes a Topo::LazyFacetedBrepShape from a model description (see Geom::BrepData) and its points
+    static pShape makeLazyFacetedBrepShape(const std::vector<int>& model, const std::vector<Geom::Pnt>& vertices, Geom::PointListSet& defectPolygons);
     /// Makes a mesh-shape from IndexedData
     static pShape makeInventorMeshShape(pIndexedMesh);
     /// Makes a mesh-shape from BrepData
@@ -169,6 +188,19 @@ public:
     static pShape makeShape(const std::vector<int>& model, const std::vector<Geom::Pnt>& vertices, std::vector<PNTS>& defectPolygons);
     /// Makes a shape from BrepData
     static pShape makeShape(const std::vector<Base::Int>& model, const std::vector<Geom::Pnt>& vertices, std::vector<PNTS>& defectPolygons);
+    /** @name Flat defect polygons
+     *  Same as the functions above, but the defect polygons are returned in one flat Geom::PointListSet.
+     *  @since    28.0
+     */
+    //@{
+    static pShape makeShape(pConstBrepData data, Geom::PointListSet& defectPolygons);
+    static pShape makeShape(const std::vector<int>& model, const std::vector<Geom::Pnt>& vertices, Geom::PointListSet& defectPolygons);
+    static pShape makeShape(const std::vector<Base::Int>& model, const std::vector<Geom::Pnt>& vertices, Geom::PointListSet& defectPolygons);
+    static pShape makeLazyFacetedBrepShape(pConstBrepData data, Geom::PointListSet& defectPolygons);
+    static pShape makeInventorMeshShape(pConstBrepData data, Geom::PointListSet& defectPolygons);
+    static pShape makeOMFMeshShape(pConstBrepData data, Geom::PointListSet& defectPolygons);
+    static pIndexedMesh makeIndexedMesh(pConstBrepData data, Geom::PointListSet& defectPolygons, bool createEdges = false);
+    //@}
     /// Makes a shape from BrepData
     static void makeShapeAsync(const std::vector<int>& model,
                                const std::vector<Geom::Pnt>& vertices,
@@ -245,6 +277,41 @@ public:
                                                      bool cam_perspective = true);
     /// Returns the vertices of the shape
     static std::vector<pConstVertex> getVertices(pConstTopologicalItem item);
+    /** @name Index-only queries
+     *  Return indices (as used by getFaceByIndex(), getEdgeByIndex()) instead of a vector of
+     *  faces or edges, so no face or edge objects are created for the items that are skipped.
+     *  Use getFaceCount() etc. if only the number is needed and Topo::FaceIterator etc.
+     *  (TopologyIterator.h) to walk the items lazily.
+     *  @since    28.0
+     */
+    //@{
+    /// Indices of the faces whose bounding box intersects 'box'
+    static std::vector<int> getFaceIndicesInBox(pConstTopologicalItem item, const Geom::Bnd_Box& box);
+    /// Indices of the edges whose bounding box intersects 'box'
+    static std::vector<int> getEdgeIndicesInBox(pConstTopologicalItem item, const Geom::Bnd_Box& box);
+    /// Indices of the planar faces whose normal is within 'maxAngleRad' of 'dir'
+    static std::vector<int> getFaceIndicesByNormal(pConstTopologicalItem item, const Geom::Dir& dir, double maxAngleRad);
+    //@}
+#ifndef SWIG
+    /** @name Topology cursors
+     *  Walk the faces (wires, edges, vertices) of an item one by one with the topology explorer
+     *  of the kernel, in the order of getFaces() and getFaceByIndex(). Each next*() call costs
+     *  O(1) and creates only the item it returns. Used by Topo::FaceIterator etc.
+     *  @since    28.0
+     */
+    //@{
+    /// Starts a walk over the faces of 'item'. Returns nullptr if 'item' is nullptr.
+    static std::shared_ptr<Topo::TopologyCursor> makeFaceCursor(pConstTopologicalItem item);
+    static std::shared_ptr<Topo::TopologyCursor> makeWireCursor(pConstTopologicalItem item);
+    static std::shared_ptr<Topo::TopologyCursor> makeEdgeCursor(pConstTopologicalItem item);
+    static std::shared_ptr<Topo::TopologyCursor> makeVertexCursor(pConstTopologicalItem item);
+    /// Returns the next face of the walk over 'item' and advances 'cursor'. Returns nullptr at the end.
+    static pConstFace nextFace(pConstTopologicalItem item, Topo::TopologyCursor& cursor);
+    static pConstWire nextWire(pConstTopologicalItem item, Topo::TopologyCursor& cursor);
+    static pConstEdge nextEdge(pConstTopologicalItem item, Topo::TopologyCursor& cursor);
+    static pConstVertex nextVertex(pConstTopologicalItem item, Topo::TopologyCursor& cursor);
+    //@}
+#endif
     /// Returns the indices of all faces that contain the vertex of index 'vertexIdx'
     static std::vector<int> getAdjacentFaceIndicesFromVertexIndex(pConstTopologicalItem item, int vertexIdx);
     /// Returns all adjacent faces of an edge in a shape
@@ -282,8 +349,28 @@ public:
     static double getVolume(pConstTopologicalItem item);
     /// Computes the center of gravity of a shape. Returns false in case of error
     static bool getCentroid(pConstShape shape, Geom::Pnt& centroid);
-    ///
+    /// Marks the mass properties of the shape as outdated. With 'on' the entry of the shape in the mass properties cache is dropped as well.
     static void setNeedMassUpdate(pConstShape shape, bool on);
+    /** @name Batch mass properties
+     *  Volume, surface area, centroid and face areas of many shapes computed in parallel on
+     *  ShapeTool::getThreadPool(). The results are cached per shape: an entry is kept as long
+     *  as the shape lives and is not modified (every change of a shape calls setNeedMassUpdate()).
+     *  Elements get a new shape when their geometry is recomputed, so repeated take-offs of an
+     *  unchanged model are served from the cache.
+     *  @since    28.0
+     */
+    //@{
+    /// One entry per shape, in the order of 'shapes'. 'withAreaFromTop' also computes the (expensive) MassProperties::AreaFromTop.
+#ifndef SWIG
+    static std::vector<Topo::MassProperties> getMassProperties(const std::vector<pConstShape>& shapes, bool withAreaFromTop = false);
+#endif
+    /// Same as getMassProperties() as one row of MassProperties::TABLE_COLUMNS values per shape
+    static std::vector<double> getMassPropertiesTable(const std::vector<pConstShape>& shapes, bool withAreaFromTop = false);
+    /// Removes all entries from the mass properties cache
+    static void clearMassPropertiesCache();
+    /// Number of shapes served from the cache by getMassProperties()
+    static uint64_t getMassPropertiesCacheHitCount();
+    //@}
     /// Update the transformation of the shape and its bounding box
     static void updateShapeTransform(pConstShape shape, const Geom::Trsf& transform);
     /// Writes a shape to ostream
@@ -320,7 +407,7 @@ public:
     static pShape read(const std::string& format, const std::string& data, float version);
     /// Reads shape from fileName in given format
     /*DEPRECATED("Pass fileName as Base::String.") */ static pShape read(const std::string& format, const std::string& fileName);
-    /// Reads shape from fileName in given format
+    /// Reads shape from fileName in given format. To read many shapes on demand see Topo::ShapeCacheFile.
     static pShape read(const std::string& format, const Base::String& fileName);
 
     /** @name Boolean Operations */
@@ -335,6 +422,26 @@ public:
     static pShape s_common(pConstShape base, pConstShape tool);
     static pShape cutWithPlane(pConstShape aBlank, const Geom::Pln& aPlane, bool* ok = 0);
     static pShape splitByPlane(pConstShape aBlank, const Geom::Pln& aPlane, bool* ok = 0);
+    /**
+     * Applies 'operation' with all 'tools' to 'base' in one call.
+     * - CUT: tools whose bounding box does not intersect the box of 'base' are skipped. The remaining tools
+     *   are sorted into groups of neighbouring tools, each group is cut as one compound.
+     * - FUSE: 'base' and the tools are fused pairwise in a balanced tree on ShapeTool::getThreadPool(),
+     *   neighbouring shapes first.
+     * - COMMON: if a tool does not overlap 'base' the result is an empty compound (no faces, but not
+     *   nullptr) and the tool is marked as skipped.
+     * If a group fails, its tools are retried one by one so that only the failing tools are marked as FAILED.
+     * 'status' gets one Topo::BooleanToolStatus per tool, as int in the overload for Python (vector_int).
+     * Returns nullptr only if 'base' is invalid.
+     * @since    28.0
+     */
+    static pShape booleanMultiple(Topo::BooleanOperation operation, pConstShape base, const std::vector<pConstShape>& tools, std::vector<int>& status);
+#ifndef SWIG
+    static pShape booleanMultiple(Topo::BooleanOperation operation,
+                                  pConstShape base,
+                                  const std::vector<pConstShape>& tools,
+                                  std::vector<Topo::BooleanToolStatus>& status);
+#endif
     //@}
 
     /// Creates a copy of the shape and transforms the copy
@@ -531,6 +638,8 @@ public:
                                  const std::vector<Geom::Pnt>& vertices,
                                  bool checkShape,
                                  std::vector<std::vector<Geom::Pnt> >& defectPolygons);
+    /// Same as above, but the defect polygons are returned in one flat Geom::PointListSet
+    static pShape makePolyHedral(const std::vector<int>& model, const std::vector<Geom::Pnt>& vertices, bool checkShape, Geom::PointListSet& defectPolygons);
     static bool is_polyhedral_body(BODY const* iBody);
 
     ///////////////////////////////////////////////////////////
@@ -586,6 +695,11 @@ public:
                                                  std::map<int, Geom::Vec> aDirectionsToSortBy,
                                                  std::map<int, std::vector<pConstFace> >& aFacesListMap,
                                                  float aMaxAngleRad = 0.75);
+    /// Same as getFacesByMaxNormalToVectorAngle() but returns face indices
+    static void getFaceIndicesByMaxNormalToVectorAngle(pConstShape aShape,
+                                                       std::map<int, Geom::Vec> aDirectionsToSortBy,
+                                                       std::map<int, std::vector<int> >& aFaceIndicesMap,
+                                                       float aMaxAngleRad = 0.75);
     /// Gets the TopoDS_Shape of 'shape'. Returns 'true' on success, 'false' if shape has no TopoDS_Shape or the TopoDS_Shape is Null.
     static bool getTopoDS_Shape(pConstTopologicalItem shape, TopoDS_Shape& topoShape);
 
@@ -662,6 +776,17 @@ protected:
     virtual std::vector<pConstEdge> _getEdges(pConstTopologicalItem item);
     virtual std::vector<pConstEdge> _getAllEdges(pConstTopologicalItem item);
     virtual std::vector<pConstVertex> _getVertices(pConstTopologicalItem item);
+    virtual std::shared_ptr<Topo::TopologyCursor> _makeFaceCursor(pConstTopologicalItem item);
+    virtual std::shared_ptr<Topo::TopologyCursor> _makeWireCursor(pConstTopologicalItem item);
+    virtual std::shared_ptr<Topo::TopologyCursor> _makeEdgeCursor(pConstTopologicalItem item);
+    virtual std::shared_ptr<Topo::TopologyCursor> _makeVertexCursor(pConstTopologicalItem item);
+    virtual pConstFace _nextFace(pConstTopologicalItem item, Topo::TopologyCursor& cursor);
+    virtual pConstWire _nextWire(pConstTopologicalItem item, Topo::TopologyCursor& cursor);
+    virtual pConstEdge _nextEdge(pConstTopologicalItem item, Topo::TopologyCursor& cursor);
+    virtual pConstVertex _nextVertex(pConstTopologicalItem item, Topo::TopologyCursor& cursor);
+    virtual std::vector<int> _getFaceIndicesInBox(pConstTopologicalItem item, const Geom::Bnd_Box& box);
+    virtual std::vector<int> _getEdgeIndicesInBox(pConstTopologicalItem item, const Geom::Bnd_Box& box);
+    virtual std::vector<int> _getFaceIndicesByNormal(pConstTopologicalItem item, const Geom::Dir& dir, double maxAngleRad);
 
 
     virtual int _getIndexFromFace(pConstTopologicalItem item, pConstFace face);
@@ -690,6 +815,7 @@ protected:
     virtual double _getSurfaceArea(pConstTopologicalItem item);
     virtual bool _getCentroid(pConstShape shape, Geom::Pnt& centroid);
     virtual void _setNeedMassUpdate(pConstShape shape, bool on);
+    virtual std::vector<Topo::MassProperties> _getMassProperties(const std::vector<pConstShape>& shapes, bool withAreaFromTop);
     virtual void _updateShapeTransform(pConstShape shape, const Geom::Trsf& transform);
     virtual bool _write(pConstShape shape, std::ostream& writer);
     virtual bool _write(pConstShape shape, Base::AbstractWriter& writer);
@@ -718,6 +844,10 @@ protected:
     virtual pShape _fuse(pConstShape base, pConstShape tool, bool* ok);
     virtual bool _imprint(pShape base, pShape tool);
     virtual pShape _common(pConstShape base, pConstShape tool, bool* ok);
+    virtual pShape _booleanMultiple(Topo::BooleanOperation operation,
+                                    pConstShape base,
+                                    const std::vector<pConstShape>& tools,
+                                    std::vector<Topo::BooleanToolStatus>& status);
     virtual pShape _section(pConstShape base, pConstShape tool, bool* ok);
     virtual pShape _s_cut(pConstShape base, pConstShape tool);
     virtual pShape _s_common(pConstShape base, pConstShape tool);
@@ -821,6 +951,10 @@ protected:
     virtual size_t _getAttributeCount(pConstTopologicalItem shape);
     virtual int _getFaceIndexByPointOnFace(pConstTopologicalItem shape, const Geom::Pnt& p);
     virtual std::vector<int> _getFaceIndexesByPointOnFace(pConstTopologicalItem shape, const Geom::Pnt& p);
+    virtual void _getFaceIndicesByMaxNormalToVectorAngle(pConstShape aShape,
+                                                         std::map<int, Geom::Vec> aDirectionsToSortBy,
+                                                         std::map<int, std::vector<int> >& aFaceIndicesMap,
+                                                         float aMaxAngleRad);
 
     virtual Topo::ThreadPool* _getThreadPool();
     virtual bool _setCdwkSATAttributes(pConstShape shape, const Topo::Cdwk_SAT_Attributes& att);
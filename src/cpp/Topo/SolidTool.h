@@ -2,6 +2,7 @@
 
 #include <Topo/Types.h>
 #include <Geom/Pnt.h>
+#include <Geom/PointListSet.h>
 
 namespace Topo
 {
@@ -33,6 +34,10 @@ public:
     static pSolid makeSolid_by_Face_stiching(const std::vector<int>& model,
                                              const std::vector<Geom::Pnt>& vertices,
                                              std::vector<std::vector<Geom::Pnt> >& defectPolygons);
+    /// Makes a solid from a model description and a vector of points. The defect polygons are returned in one flat Geom::PointListSet.
+    static pSolid makeSolid(const std::vector<int>& model, const std::vector<Geom::Pnt>& vertices, Geom::PointListSet& defectPolygons);
+    /// Makes a solid from a model description and a vector of points. The defect polygons are returned in one flat Geom::PointListSet.
+    static pSolid makeSolid_by_Face_stiching(const std::vector<int>& model, const std::vector<Geom::Pnt>& vertices, Geom::PointListSet& defectPolygons);
     /// Makes a solid from a closed shape. Returns nullptr on failure.
     static pSolid makeSolid(pConstShape shape);
     /// Returns centre of mass (centre of gravity) of the solid
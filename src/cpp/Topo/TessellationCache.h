@@ -0,0 +1,74 @@
+#pragma once
+
+#include <Base/String.h>
+#include <Topo/ShapeTessellationQuality.h>
+#include <Topo/Types.h>
+
+#include <cstdint>
+#include <string>
+
+namespace Topo
+{
+/**
+ * @brief Process-wide cache of shape tessellations (Topo::IndexedDrawable).
+ *
+ * The key is a fingerprint of the shape geometry (MD5 of the saved geometry, independent of
+ * the shape's address and attributes) combined with the Topo::ShapeTessellationQuality.
+ * Identical geometry is therefore tessellated only once, regardless of how often it is
+ * exported or in how many documents it appears.
+ *
+ * - The in-memory store is an LRU list limited to getMemoryBudget() bytes.
+ * - The optional disk store (setDiskCacheDirectory(), e.g. a folder next to the document)
+ *   keeps evicted and new entries in one file per key. Disk entries are verified with
+ *   IndexedDrawable::createMD5() when they are read, damaged entries are dropped.
+ *
+ * Shape::getIndexedDrawable(), MeshTool::triangulationToMesh() and the exporters look up
+ * the cache before tessellating when the cache is enabled. All functions are thread safe.
+ *
+ * @ingroup TOPO_SHAPETOOLS
+ * @since    28.0
+ */
+class LX_TOPO_EXPORT TessellationCache
+{
+public:
+    /// The cache is disabled by default
+    static void setEnabled(bool on);
+    static bool isEnabled();
+
+    /// Maximal size of the in-memory store in bytes. Default is 256 MB.
+    static void setMemoryBudget(uint64_t bytes);
+    static uint64_t getMemoryBudget();
+    /// Directory of the disk store. An empty string disables the disk store.
+    static void setDiskCacheDirectory(const Base::String& directory);
+    static Base::String getDiskCacheDirectory();
+
+    /// Cache key of 'shape' tessellated with 'quality'. Returns an empty string if the shape cannot be fingerprinted.
+    static std::string createKey(pConstShape shape, const Topo::ShapeTessellationQuality& quality);
+    /// Returns the cached tessellation or nullptr. Counts a hit or a miss.
+    static pIndexedDrawable find(const std::string& key);
+    static void insert(const std::string& key, pIndexedDrawable drawable);
+    /// Returns the cached tessellation of 'shape' or tessellates it and inserts the result
+    static pIndexedDrawable getOrCreate(pConstShape shape, const Topo::ShapeTessellationQuality& quality);
+
+    /// Removes all entries from memory. With 'includingDisk' the disk store is emptied as well.
+    static void clear(bool includingDisk = false);
+
+    /** @name Statistics */
+    //@{
+    static uint64_t getHitCount();
+    /// Hits served from the disk store (part of getHitCount())
+    static uint64_t getDiskHitCount();
+    static uint64_t getMissCount();
+    static uint64_t getEvictionCount();
+    /// Number of entries in memory
+    static uint64_t getEntryCount();
+    /// Bytes used by the entries in memory
+    static uint64_t getMemoryUsage();
+    static void resetStatistics();
+    //@}
+
+private:
+    TessellationCache() = delete;
+};
+
+}  // namespace Topo
@@ -0,0 +1,168 @@
+#pragma once
+
+#include <Topo/ShapeTool.h>
+#include <Topo/Types.h>
+
+#include <memory>
+
+namespace Topo
+{
+/**
+ * @brief Walks the faces, wires, edges or vertices of a topological item one by one.
+ *
+ * The iterator advances a ShapeTool topology cursor (ShapeTool::makeFaceCursor(),
+ * ShapeTool::nextFace(), ...) over the explorer of the kernel. Unlike ShapeTool::getFaces()
+ * and friends no vector with all items is built and each step costs O(1), so a search which
+ * stops at the first match only pays for the items it has visited. The items come in the
+ * order of ShapeTool::getFaces(): getIndex() is the index of the current item, i.e. the index
+ * used by ShapeTool::getFaceByIndex() and returned by ShapeTool::getIndexFromFace().
+ *
+ * @code
+ * it = Topo.FaceIterator(shape)
+ * while it.more():
+ *     face = it.next()
+ *     if Topo.FaceTool.isValidPointForFace(p, face):
+ *         break
+ * @endcode
+ *
+ * @ingroup TOPO_SHAPETOOLS
+ * @since    28.0
+ */
+template <class T>
+class BasicTopologyIterator
+{
+public:
+    typedef std::shared_ptr<T const> value_type;
+
+    explicit BasicTopologyIterator(pConstTopologicalItem item) : _item(item), _index(-1), _count(-1), _fetched(false) {}
+
+    /// Returns true if next() returns another item
+    bool more() const
+    {
+        _fetch();
+        return _next != nullptr;
+    }
+    /// Moves to the next item and returns it. Returns nullptr at the end.
+    value_type next()
+    {
+        _fetch();
+        value_type item = _next;
+        _next.reset();
+        _fetched = false;
+        _index = item ? _index + 1 : -2;
+        return item;
+    }
+    /// Index of the item returned by the last next(), -1 before the first call and at the end
+    int getIndex() const { return _index >= 0 ? _index : -1; }
+    /// Number of items (ShapeTool::getFaceCount(), ...). Does not move the iterator.
+    int size() const
+    {
+        if (_count < 0)
+            _count = _item ? _getCount(_item) : 0;
+        return _count;
+    }
+    /// Starts again at the first item
+    void reset()
+    {
+        _cursor.reset();
+        _next.reset();
+        _fetched = false;
+        _index = -1;
+    }
+
+private:
+    // Reads the item after the current one (once per step), so that more() can answer without moving the iterator
+    void _fetch() const
+    {
+        if (_fetched)
+            return;
+        _fetched = true;
+        if (!_item || _index == -2)
+            return;
+        if (!_cursor)
+            _cursor = _makeCursor(_item);
+        if (_cursor)
+            _next = _getNext(_item, *_cursor);
+    }
+
+    static int _getCount(pConstTopologicalItem item);
+    static std::shared_ptr<Topo::TopologyCursor> _makeCursor(pConstTopologicalItem item);
+    static value_type _getNext(pConstTopologicalItem item, Topo::TopologyCursor& cursor);
+
+    pConstTopologicalItem _item;
+    int _index;
+    mutable int _count;
+    mutable bool _fetched;
+    mutable std::shared_ptr<Topo::TopologyCursor> _cursor;
+    mutable value_type _next;
+};
+
+#ifndef SWIG
+template <>
+inline int BasicTopologyIterator<Topo::Face>::_getCount(pConstTopologicalItem item)
+{
+    return ShapeTool::getFaceCount(item);
+}
+template <>
+inline std::shared_ptr<Topo::TopologyCursor> BasicTopologyIterator<Topo::Face>::_makeCursor(pConstTopologicalItem item)
+{
+    return ShapeTool::makeFaceCursor(item);
+}
+template <>
+inline pConstFace BasicTopologyIterator<Topo::Face>::_getNext(pConstTopologicalItem item, Topo::TopologyCursor& cursor)
+{
+    return ShapeTool::nextFace(item, cursor);
+}
+template <>
+inline int BasicTopologyIterator<Topo::Wire>::_getCount(pConstTopologicalItem item)
+{
+    return ShapeTool::getWireCount(item);
+}
+template <>
+inline std::shared_ptr<Topo::TopologyCursor> BasicTopologyIterator<Topo::Wire>::_makeCursor(pConstTopologicalItem item)
+{
+    return ShapeTool::makeWireCursor(item);
+}
+template <>
+inline pConstWire BasicTopologyIterator<Topo::Wire>::_getNext(pConstTopologicalItem item, Topo::TopologyCursor& cursor)
+{
+    return ShapeTool::nextWire(item, cursor);
+}
+template <>
+inline int BasicTopologyIterator<Topo::Edge>::_getCount(pConstTopologicalItem item)
+{
+    return ShapeTool::getEdgeCount(item);
+}
+template <>
+inline std::shared_ptr<Topo::TopologyCursor> BasicTopologyIterator<Topo::Edge>::_makeCursor(pConstTopologicalItem item)
+{
+    return ShapeTool::makeEdgeCursor(item);
+}
+template <>
+inline pConstEdge BasicTopologyIterator<Topo::Edge>::_getNext(pConstTopologicalItem item, Topo::TopologyCursor& cursor)
+{
+    return ShapeTool::nextEdge(item, cursor);
+}
+template <>
+inline int BasicTopologyIterator<Topo::Vertex>::_getCount(pConstTopologicalItem item)
+{
+    return ShapeTool::getVertexCount(item);
+}
+template <>
+inline std::shared_ptr<Topo::TopologyCursor> BasicTopologyIterator<Topo::Vertex>::_makeCursor(pConstTopologicalItem item)
+{
+    return ShapeTool::makeVertexCursor(item);
+}
+template <>
+inline pConstVertex BasicTopologyIterator<Topo::Vertex>::_getNext(pConstTopologicalItem item, Topo::TopologyCursor& cursor)
+{
+    return ShapeTool::nextVertex(item, cursor);
+}
+#endif
+
+typedef BasicTopologyIterator<Topo::Face> FaceIterator;
+typedef BasicTopologyIterator<Topo::Wire> WireIterator;
+typedef BasicTopologyIterator<Topo::Edge> EdgeIterator;
+typedef BasicTopologyIterator<Topo::Vertex> VertexIterator;
+
+}  // namespace Topo
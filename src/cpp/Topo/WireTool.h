@@ -1,5 +1,6 @@
 #pragma once
 #include <Topo/Types.h>
+#include <Geom/PointListSet.h>
 #include <Geom/Precision.h>
 #include <vector>
 
@@ -9,6 +10,7 @@ class Pln;
 class Pnt;
 class Dir;
 class Trsf;
+class Vec;
 }
 
 namespace Topo
@@ -123,6 +125,44 @@ public:
     static pWire joined(pConstWire wire1, pConstWire wire2);
     /// Gets the plane of a 3D wire.
     static bool getWirePlane(pConstWire wire, Geom::Pln& plane);
+    /// Returns the length of the wire (sum of the edge lengths)
+    static double getLength(pConstWire wire);
+    /// Discretizes the wire with the default tolerances of the modeling kernel
+    static bool discretize(pConstWire wire, std::vector<Geom::Pnt>& points);
+    /// Evaluates the wire at the arc lengths 'lengths' measured from the start of the wire (0..getLength()). Each length is
+    /// mapped onto the edge it falls on (in getEdges() order, respecting the edge orientation). The derivatives up to order
+    /// 'derivatives' (0..3) are taken with respect to the arc length, so 'd1' is the unit tangent. The outputs get one entry
+    /// per length, the derivatives above 'derivatives' are left empty; 'edgeIndices' gets the index of the edge of every
+    /// length. Lengths outside the wire are clamped. Returns false if the wire has no edges.
+    static bool evaluateAtLength(pConstWire wire,
+                                 const std::vector<double>& lengths,
+                                 int derivatives,
+                                 std::vector<Geom::Pnt>& points,
+                                 std::vector<Geom::Vec>& d1,
+                                 std::vector<Geom::Vec>& d2,
+                                 std::vector<Geom::Vec>& d3,
+                                 std::vector<int>& edgeIndices);
+#ifndef SWIG
+    /// Same as above for 'count' lengths, points and derivatives are written as x,y,z triplets into buffers allocated
+    /// by the caller. Pass nullptr for outputs that are not needed.
+    static bool evaluateAtLength(pConstWire wire,
+                                 const double* lengths,
+                                 int64_t count,
+                                 int derivatives,
+                                 double* points,
+                                 double* d1 = nullptr,
+                                 double* d2 = nullptr,
+                                 double* d3 = nullptr,
+                                 int64_t* edgeIndices = nullptr);
+#endif
+    /// Adaptive discretization of all edges of the wire (see EdgeTool::discretize()). Shared vertices are only added once.
+    static bool discretize(pConstWire wire, double chordHeight, double angularDeviation, double maxSegmentLength, std::vector<Geom::Pnt>& points);
+    /// discretize() for many wires in parallel, polyline i of 'polylines' belongs to wire i. Returns false if a wire failed (its polyline is empty).
+    static bool discretize(const std::vector<pConstWire>& wires,
+                           double chordHeight,
+                           double angularDeviation,
+                           double maxSegmentLength,
+                           Geom::PointListSet& polylines);
 
     ///////////////////////////////////////////////////////////
     //                                                       //
@@ -178,6 +218,18 @@ protected:
     virtual pWire _reversed(pConstWire wire);
     virtual pWire _joined(pConstWire wire1, pConstWire wire2);
     virtual bool _getWirePlane(pConstWire& wire, Geom::Pln& pln);
+    virtual double _getLength(pConstWire wire);
+    virtual bool _discretize(pConstWire wire, std::vector<Geom::Pnt>& points);
+    virtual bool _evaluateAtLength(pConstWire wire,
+                                   const double* lengths,
+                                   int64_t count,
+                                   int derivatives,
+                                   double* points,
+                                   double* d1,
+                                   double* d2,
+                                   double* d3,
+                                   int64_t* edgeIndices);
+    virtual bool _discretize(pConstWire wire, double chordHeight, double angularDeviation, double maxSegmentLength, std::vector<Geom::Pnt>& points);
     virtual pWire
     _combineWireWithWire(pConstWire hWire, pConstWire vWire, const uint& x, const uint& y, const uint& z, const double& start, const double& end);
     static Topo::WireTool* _defaultTool;